@@ -0,0 +1,321 @@
+"""
+Benchmarks over synthetic module trees generated with `DirectoryLayout`.
+
+Usage::
+
+    python benchmarks/run.py run [-o results.json] [--files N] [--classes M] [--depth K]
+    python benchmarks/run.py compare base.json new.json [--threshold 0.1]
+
+The ``compare`` command exits with non-zero code when median time of any benchmark
+present in both files increased by more than ``threshold`` (relative).
+"""
+
+import argparse
+from contextlib import contextmanager
+from functools import partial
+import gc
+import json
+import platform
+import statistics
+import sys
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator, Optional
+
+import importloc
+from importloc import (
+    ConflictResolution,
+    Location,
+    ModuleLocation,
+    OrderBy,
+    PathLocation,
+    ZipLocation,
+    compile_getter,
+    get_instances,
+    get_subclasses,
+    getattr_nested,
+    random_name,
+    unload,
+)
+from importloc.dirlay import DirectoryLayout, File
+
+
+Result = dict[str, float]
+
+
+# tree
+
+
+def generate_files(files: int, classes: int, depth: int) -> tuple[File, ...]:
+    """
+    Generate package ``bench`` with ``files`` modules nested ``depth`` levels deep,
+    each module defining ``classes`` subclasses of ``bench.base.Base`` and one
+    instance of each.
+    """
+    pkg = '/'.join(['bench', *(f'p{i}' for i in range(depth))])
+    layout = [File('bench/__init__.py', ''), File('bench/base.py', 'class Base: ...\n')]
+    for i in range(depth):
+        parent = '/'.join(['bench', *(f'p{k}' for k in range(i + 1))])
+        layout.append(File(f'{parent}/__init__.py', ''))
+    for i in range(files):
+        lines = ['from bench.base import Base', '']
+        for j in range(classes):
+            lines.append(f'class C{j}(Base): ...')
+            lines.append(f'c{j} = C{j}()')
+        layout.append(File(f'{pkg}/m{i}.py', '\n'.join(lines) + '\n'))
+    return tuple(layout)
+
+
+def module_paths(layout: DirectoryLayout) -> list[str]:
+    return [f.path for f in layout.files if f.path.rpartition('/')[2].startswith('m')]
+
+
+# measurement
+
+
+def measure(
+    func: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], object]] = None,
+    teardown: Optional[Callable[[], object]] = None,
+) -> Result:
+    times = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = perf_counter()
+            func()
+            times.append(perf_counter() - start)
+            if teardown is not None:
+                teardown()
+    finally:
+        gc.enable()
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'repeat': repeat,
+    }
+
+
+def loop(func: Callable[[], object], number: int) -> None:
+    for _ in range(number):
+        func()
+
+
+@contextmanager
+def isolated_modules() -> Iterator[None]:
+    before = set(sys.modules)
+    try:
+        yield
+    finally:
+        for name in set(sys.modules) - before:
+            del sys.modules[name]
+
+
+def unload_all(names: list[str]) -> None:
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+# benchmarks
+
+
+def bench_parse(specs: list[str], repeat: int) -> dict[str, Result]:
+    def parse() -> None:
+        for s in specs:
+            Location(s)
+
+    def parse_many() -> None:
+        for _ in Location.parse_many(specs):
+            pass
+
+    def parse_regex() -> None:
+        # baseline: match each location type regular expression in turn
+        for s in specs:
+            for lt in (ModuleLocation, ZipLocation, PathLocation):
+                match = lt.match(s)
+                if match:
+                    lt._from_match(s, match)
+                    break
+
+    clear = Location.parse_cache_clear
+    return {
+        'parse.cold': measure(parse, repeat, setup=clear),
+        'parse.cached': measure(parse, repeat),
+        'parse.regex': measure(parse_regex, repeat),
+        'parse_many.cold': measure(parse_many, repeat, setup=clear),
+        'parse_many.cached': measure(parse_many, repeat),
+    }
+
+
+def bench_load(paths: list[str], repeat: int) -> dict[str, Result]:
+    locs = [Location(p) for p in paths]
+    names = [p.rpartition('/')[2][:-3] for p in paths]
+    results = {}
+
+    def load_all(on_conflict: ConflictResolution) -> Callable[[], None]:
+        def func() -> None:
+            for loc in locs:
+                loc.load(on_conflict=on_conflict, rename=random_name)
+
+        return func
+
+    def preload() -> None:
+        unload_all(names)
+        load_all(ConflictResolution.RAISE)()
+
+    for cr in ConflictResolution:
+        with isolated_modules():
+            if cr == ConflictResolution.RAISE:
+                kwargs: dict[str, Any] = dict(setup=lambda: unload_all(names))
+            else:
+                kwargs = dict(setup=preload)
+            results[f'load.{cr.value}'] = measure(load_all(cr), repeat, **kwargs)
+    return results
+
+
+def bench_members(path: str, repeat: int) -> dict[str, Result]:
+    results = {}
+    with isolated_modules():
+        Location('bench.base').load()
+        base = sys.modules['bench.base'].Base
+        mod = Location(path).load()
+        for order in OrderBy:
+            for func in (get_instances, get_subclasses):
+                name = f'{func.__name__}.{order.value}'
+                call = partial(func, mod, base, order=order)
+                results[name] = measure(partial(loop, call, 100), repeat)
+    return results
+
+
+def bench_getattr_nested(repeat: int) -> dict[str, Result]:
+    results = {}
+    for depth in (1, 4, 16):
+        obj = leaf = SimpleNamespace()
+        for _ in range(depth):
+            leaf.a = SimpleNamespace()
+            leaf = leaf.a
+        name = '.'.join(['a'] * depth)
+        call = partial(getattr_nested, obj, name)
+        results[f'getattr_nested.depth{depth}'] = measure(
+            partial(loop, call, 1000), repeat
+        )
+        call = partial(compile_getter(name), obj)
+        results[f'compile_getter.depth{depth}'] = measure(
+            partial(loop, call, 1000), repeat
+        )
+    return results
+
+
+def bench_unload(paths: list[str], repeat: int) -> dict[str, Result]:
+    names = [p.rpartition('/')[2][:-3] for p in paths]
+
+    def load_all() -> None:
+        for p in paths:
+            Location(p).load(on_conflict='replace')
+
+    def unload_each() -> None:
+        for n in names:
+            unload(n)
+
+    with isolated_modules():
+        return {'unload': measure(unload_each, repeat, setup=load_all)}
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    layout = DirectoryLayout(files=generate_files(args.files, args.classes, args.depth))
+    layout.create()
+    layout.pushd()
+    sys.path.insert(0, str(layout.cwd))
+    try:
+        paths = module_paths(layout)
+        results: dict[str, Result] = {}
+        specs = [f'{p}:c0' for p in paths]
+        specs += [f'{p[:-3].replace("/", ".")}:c0' for p in paths]
+        results.update(bench_parse(specs, args.repeat))
+        results.update(bench_load(paths, args.repeat))
+        results.update(bench_members(paths[0], args.repeat))
+        results.update(bench_getattr_nested(args.repeat))
+        results.update(bench_unload(paths, args.repeat))
+    finally:
+        sys.path.remove(str(layout.cwd))
+        layout.popd()
+        layout.destroy()
+    return {
+        'meta': {
+            'importloc': importloc.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'files': args.files,
+            'classes': args.classes,
+            'depth': args.depth,
+        },
+        'results': results,
+    }
+
+
+# comparison
+
+
+def compare(base: dict[str, Any], new: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Print comparison table and return names of regressed benchmarks.
+    """
+    regressed = []
+    print(f'{"benchmark":32} {"base,ms":>10} {"new,ms":>10} {"change":>8}')
+    for name, res in new['results'].items():
+        if name not in base['results']:
+            continue
+        old_t, new_t = base['results'][name]['median'], res['median']
+        change = (new_t - old_t) / old_t if old_t else 0.0
+        flag = ''
+        if change > threshold:
+            regressed.append(name)
+            flag = '  REGRESSION'
+        print(
+            f'{name:32} {old_t * 1e3:>10.3f} {new_t * 1e3:>10.3f} {change:>+8.1%}{flag}'
+        )
+    return regressed
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    commands = parser.add_subparsers(dest='command', required=True)
+    p = commands.add_parser('run', help='run benchmarks')
+    p.add_argument('-o', '--output', help='save results to JSON file')
+    p.add_argument('--files', type=int, default=100, help='number of modules')
+    p.add_argument('--classes', type=int, default=10, help='classes per module')
+    p.add_argument('--depth', type=int, default=3, help='package nesting depth')
+    p.add_argument('--repeat', type=int, default=5, help='repetitions per benchmark')
+    p = commands.add_parser('compare', help='compare two result files')
+    p.add_argument('base')
+    p.add_argument('new')
+    p.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        data = run(args)
+        text = json.dumps(data, indent=2)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(text + '\n')
+        else:
+            print(text)
+        return 0
+    else:
+        with open(args.base) as f:
+            base = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        regressed = compare(base, new, args.threshold)
+        if regressed:
+            print(f'\n{len(regressed)} benchmark(s) regressed: {", ".join(regressed)}')
+            return 1
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,28 +1,89 @@
-from .exc import InvalidLocation, ModuleNameConflict
-from .location import ConflictResolution, Location, ModuleLocation, PathLocation, unload
+from .batch import load_many
+from .cache import (
+    CodeCache,
+    clear_object_cache,
+    clear_path_cache,
+    disable_code_cache,
+    disable_file_registry,
+    disable_path_cache,
+    enable_code_cache,
+    enable_file_registry,
+    enable_path_cache,
+    get_code_cache,
+)
+from .events import LoadEvent, LoadStats, subscribe, unsubscribe
+from .exc import (
+    InvalidLocation,
+    LoadManyError,
+    ModuleLockDeadlock,
+    ModuleNameConflict,
+)
+from .lazy import LazyObject
+from .location import (
+    ConflictResolution,
+    Location,
+    ModuleLocation,
+    PathLocation,
+    ZipLocation,
+    reload,
+    unload,
+)
+from .manifest import Manifest
+from .scan import iter_instances, iter_subclasses, walk_modules
 from .util import (
     OrderBy,
+    compile_getter,
     get_instances,
     get_subclasses,
     getattr_nested,
     random_name,
+    walk_subclasses,
 )
+from .watch import ReloadEvent, Watcher
 
 
 __version__ = '0.3.1'
 
 __all__ = [
     '__version__',
+    'CodeCache',
     'ConflictResolution',
     'InvalidLocation',
+    'LazyObject',
+    'LoadEvent',
+    'LoadManyError',
+    'LoadStats',
     'Location',
+    'Manifest',
+    'ModuleLockDeadlock',
     'ModuleNameConflict',
     'ModuleLocation',
     'OrderBy',
     'PathLocation',
+    'ReloadEvent',
+    'Watcher',
+    'ZipLocation',
+    'clear_object_cache',
+    'clear_path_cache',
+    'compile_getter',
+    'disable_code_cache',
+    'disable_file_registry',
+    'disable_path_cache',
+    'enable_code_cache',
+    'enable_file_registry',
+    'enable_path_cache',
+    'get_code_cache',
     'get_instances',
     'get_subclasses',
     'getattr_nested',
+    'iter_instances',
+    'iter_subclasses',
+    'load_many',
     'random_name',
+    'reload',
+    'subscribe',
     'unload',
+    'unsubscribe',
+    'walk_modules',
+    'walk_subclasses',
 ]
@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+from typing import Any, Callable, Iterable, Optional, Union
+
+from .exc import LoadManyError
+from .location import (
+    ConflictResolution,
+    Location,
+    PreparedFile,
+    atomic_import,
+    module_lock,
+    resolve_conflict,
+)
+
+
+def load_many(
+    locations: Iterable[Union[Location, str, Path]],
+    on_conflict: Union[ConflictResolution, str] = 'raise',
+    rename: Optional[Callable[[str, Any], str]] = None,
+    workers: Optional[int] = None,
+) -> list[object]:
+    """
+    Load multiple locations, preparing them concurrently.
+
+    Loading is performed in two stages:
+
+    1. Locations are grouped by module source (source file path or module name;
+       locations that differ only by ``obj`` share one group), and I/O bound
+       preparation (path resolution and validation, reading and compiling source
+       code) is performed in a thread pool. Source code is not read for modules
+       that will be reused from `sys.modules`. No module code is executed at this
+       stage.
+    2. Modules are executed on the calling thread, in order of their first
+       appearance in ``locations``. Each module is imported with the same conflict
+       resolution and atomicity rules as `Location.load()
+       <importloc.location.Location.load>`: if module import fails or any of
+       requested objects is missing, the module is rolled back.
+
+    Errors don't stop loading of other modules; they are collected and raised
+    together after all modules are processed.
+
+    Args:
+        locations (``Iterable[Location | str | Path]``):
+            locations or location specs to be loaded.
+        on_conflict (`ConflictResolution` | ``str``):
+            behaviour if module name is already present in `sys.modules`.
+        rename (``Callable[[str, Location], str]``):
+            callable used to generate new module name, see `Location.load()
+            <importloc.location.Location.load>`.
+        workers (``int`` | ``None``):
+            maximum number of preparation threads, see
+            `~concurrent.futures.ThreadPoolExecutor`.
+
+    Raises:
+        `LoadManyError`: when some of locations failed to load; exception object
+            holds both errors and objects loaded successfully.
+
+    Returns:
+        ``list[object]``: loaded objects, in the same order as ``locations``.
+
+    Example:
+        >>> plugins = load_many(['app/plugins/a.py:Plugin', 'app.plugins.b:Plugin'])
+    """
+    locs = [loc if isinstance(loc, Location) else Location(loc) for loc in locations]
+    # group by module source
+    groups: dict[tuple[Any, ...], list[Location]] = {}
+    for loc in locs:
+        groups.setdefault(loc._source(), []).append(loc)
+    # prepare
+    # compile only if module is going to be executed, e.g. not when reused;
+    # conflict is resolved again by _load_group while holding module lock
+    replace = ConflictResolution(on_conflict) in (
+        ConflictResolution.REPLACE,
+        ConflictResolution.RENAME,
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                g[0]._prepare, replace or g[0]._default_modname() not in sys.modules
+            )
+            for g in groups.values()
+        ]
+    # execute
+    results: dict[Location, object] = {}
+    errors: dict[Location, Exception] = {}
+    for group, future in zip(groups.values(), futures):
+        try:
+            prepared = future.result()
+            values = _load_group(group, prepared, on_conflict, rename)
+        except Exception as exc:
+            errors.update((loc, exc) for loc in group)
+        else:
+            results.update(zip(group, values))
+    if errors:
+        raise LoadManyError(
+            [(loc, errors[loc]) for loc in locs if loc in errors], results
+        )
+    return [results[loc] for loc in locs]
+
+
+def _load_group(
+    group: list[Location],
+    prepared: Optional[PreparedFile],
+    on_conflict: Union[ConflictResolution, str],
+    rename: Optional[Callable[[str, Any], str]],
+) -> list[object]:
+    first = group[0]
+    modname = first._default_modname()
+    with module_lock(modname):
+        modname, action, _ = resolve_conflict(modname, on_conflict, rename, first)
+        with atomic_import(modname):
+            modobj = first._import(modname, action, prepared)
+            return [loc._get_obj(modobj) for loc in group]
@@ -0,0 +1,360 @@
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import sys
+from threading import Lock
+from types import CodeType, ModuleType
+from typing import Hashable, NamedTuple, Optional, Protocol, Tuple, Union
+from weakref import WeakValueDictionary
+
+
+class CodeLoader(Protocol):
+    name: str
+
+    def get_code(self, fullname: str) -> Optional[CodeType]: ...
+
+
+class CacheInfo(NamedTuple):
+    """
+    Cache statistics, similar to `functools.lru_cache` ``cache_info()``.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class Fingerprint(NamedTuple):
+    """
+    Source file fingerprint recorded on modules loaded from files.
+
+    Content ``digest`` is computed lazily, when file stat alone is not enough to tell
+    whether the content has changed.
+    """
+
+    mtime_ns: int
+    size: int
+    digest: Optional[bytes] = None
+
+
+def file_digest(path: Union[str, os.PathLike[str]]) -> bytes:
+    """
+    Get file content hash.
+    """
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+
+class CodeCache:
+    """
+    Bounded LRU cache of module code objects, keyed by file identity.
+
+    Each entry is stored under resolved file path and is valid as long as file
+    ``st_mtime_ns`` and ``st_size`` remain unchanged; otherwise the entry is
+    replaced on next lookup. When cache size exceeds ``maxsize``, least recently
+    used entries are evicted.
+
+    Args:
+        maxsize (``int``):
+            maximum number of cached code objects.
+
+    Raises:
+        `ValueError`: when ``maxsize`` is not positive.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, Tuple[int, int, CodeType]] = OrderedDict()
+        self._lock = Lock()
+
+    def get_code(
+        self,
+        loader: CodeLoader,
+        path: str,
+        stat: Optional[os.stat_result] = None,
+    ) -> CodeType:
+        """
+        Get code object for file ``path``, compiling it with ``loader`` on cache miss.
+
+        Args:
+            loader (``CodeLoader``):
+                file loader for ``path``, e.g. `importlib.machinery.SourceFileLoader`.
+            path (``str``):
+                resolved file path.
+            stat (`os.stat_result` | ``None``):
+                result of `os.stat` for ``path``, if already known.
+
+        Raises:
+            `ImportError`: when ``loader`` does not return code object.
+            `OSError`: when file cannot be accessed.
+        """
+        st = os.stat(path) if stat is None else stat
+        with self._lock:
+            entry = self._data.get(path)
+            if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                self._data.move_to_end(path)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+        # compile outside the lock, concurrent misses for the same path are harmless
+        code = loader.get_code(loader.name)
+        if code is None:
+            raise ImportError(f'Cannot get code object for module {loader.name}')
+        with self._lock:
+            self._data[path] = (st.st_mtime_ns, st.st_size, code)
+            self._data.move_to_end(path)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return code
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get cache statistics.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        """
+        Remove all cache entries and reset statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_code_cache: Optional[CodeCache] = None
+
+
+def enable_code_cache(maxsize: int = 256) -> CodeCache:
+    """
+    Enable in-process code object cache used when loading modules from files.
+
+    When enabled, repeated `PathLocation.load() <importloc.location.PathLocation.load>`
+    and reloads of the same unchanged file skip reading, unmarshalling and compiling
+    the code. Calling this function again replaces existing cache with the new one.
+
+    Args:
+        maxsize (``int``):
+            maximum number of cached code objects.
+
+    Returns:
+        `CodeCache`: enabled cache object, e.g. to inspect ``cache_info()``.
+
+    Example:
+        >>> cache = enable_code_cache(maxsize=1024)
+        >>> cache.cache_info()
+        CacheInfo(hits=0, misses=0, maxsize=1024, currsize=0)
+    """
+    global _code_cache
+    _code_cache = CodeCache(maxsize)
+    return _code_cache
+
+
+def disable_code_cache() -> None:
+    """
+    Disable and drop code object cache.
+    """
+    global _code_cache
+    _code_cache = None
+
+
+def get_code_cache() -> Optional[CodeCache]:
+    """
+    Get code object cache if enabled, otherwise `None`.
+    """
+    return _code_cache
+
+
+class ObjectCache:
+    """
+    Cache of objects returned by `Location.load(cache=True)
+    <importloc.location.Location.load>`.
+
+    Entry is valid while the module it was loaded from is still present in
+    `sys.modules` under the same name; modules reloaded or unloaded with `importloc`
+    functions invalidate their entries explicitly.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[Hashable, Tuple[str, ModuleType, object]] = {}
+        self._keys: dict[str, set[Hashable]] = {}
+        # keys by module identity, module may be present under several names
+        self._modkeys: dict[int, set[Hashable]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> object:
+        """
+        Get cached object or `MISSING` sentinel.
+        """
+        entry = self._data.get(key)
+        if entry is not None and sys.modules.get(entry[0]) is entry[1]:
+            return entry[2]
+        return MISSING
+
+    def put(self, key: Hashable, modname: str, modobj: ModuleType, obj: object) -> None:
+        """
+        Store object loaded from module ``modobj`` imported as ``modname``.
+        """
+        with self._lock:
+            self._data[key] = (modname, modobj, obj)
+            self._keys.setdefault(modname, set()).add(key)
+            self._modkeys.setdefault(id(modobj), set()).add(key)
+
+    def invalidate(self, module: Union[str, ModuleType]) -> None:
+        """
+        Remove all objects loaded from module imported as ``module``, if `str`;
+        or from module object ``module`` under any name, if `~types.ModuleType`.
+        """
+        with self._lock:
+            if isinstance(module, str):
+                keys = self._keys.pop(module, set())
+            else:
+                keys = self._modkeys.pop(id(module), set())
+            for key in keys:
+                entry = self._data.get(key)
+                # key may have been overwritten with an object from another module
+                if entry is not None and (
+                    isinstance(module, str) or entry[1] is module
+                ):
+                    del self._data[key]
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._data.clear()
+            self._keys.clear()
+            self._modkeys.clear()
+
+
+#: Sentinel returned by `ObjectCache.get` on cache miss.
+MISSING = object()
+
+_object_cache = ObjectCache()
+
+
+def get_object_cache() -> ObjectCache:
+    """
+    Get cache of objects loaded with ``cache=True``.
+    """
+    return _object_cache
+
+
+def clear_object_cache() -> None:
+    """
+    Clear cache of objects loaded with ``cache=True``.
+    """
+    _object_cache.clear()
+
+
+_resolved_paths: Optional[dict[tuple[str, str], Path]] = None
+_resolved_paths_lock = Lock()
+
+
+def enable_path_cache() -> None:
+    """
+    Enable cache of resolved location file paths, keyed by current working directory
+    and location path.
+
+    When enabled, `PathLocation.load() <importloc.location.PathLocation.load>`
+    skips resolving symlinks and relative path components on every call. Cached
+    paths are not revalidated: call `clear_path_cache` when directories or symlinks
+    along cached paths are changed.
+    """
+    global _resolved_paths
+    with _resolved_paths_lock:
+        if _resolved_paths is None:
+            _resolved_paths = {}
+
+
+def disable_path_cache() -> None:
+    """
+    Disable and drop resolved path cache.
+    """
+    global _resolved_paths
+    with _resolved_paths_lock:
+        _resolved_paths = None
+
+
+def clear_path_cache() -> None:
+    """
+    Remove all entries from resolved path cache, if enabled.
+    """
+    with _resolved_paths_lock:
+        if _resolved_paths is not None:
+            _resolved_paths.clear()
+
+
+def resolve_path(path: Path) -> Path:
+    # same as path.resolve(), cached if enabled
+    cache = _resolved_paths
+    if cache is None:
+        return path.resolve()
+    key = ('' if path.is_absolute() else os.getcwd(), str(path))
+    resolved = cache.get(key)
+    if resolved is None:
+        resolved = cache[key] = path.resolve()
+    return resolved
+
+
+_file_registry: 'Optional[WeakValueDictionary[tuple[int, int, int], ModuleType]]' = None
+_file_registry_lock = Lock()
+
+
+def enable_file_registry() -> None:
+    """
+    Enable registry of modules loaded from files, keyed by file identity
+    ``(st_dev, st_ino, st_mtime_ns)``.
+
+    When enabled, loading unchanged file that was already loaded by
+    `PathLocation.load() <importloc.location.PathLocation.load>` under another
+    module name, e.g. with ``modname=random_name`` or with different path spelling
+    like ``plugins/../plugins/a.py`` or symlink, does not execute the file again:
+    existing module object is added to `sys.modules` under the new name. Modules are
+    held by weak references, and are reused only while present in `sys.modules`
+    under their original name.
+    """
+    global _file_registry
+    with _file_registry_lock:
+        if _file_registry is None:
+            _file_registry = WeakValueDictionary()
+
+
+def disable_file_registry() -> None:
+    """
+    Disable and drop file identity registry.
+    """
+    global _file_registry
+    with _file_registry_lock:
+        _file_registry = None
+
+
+def lookup_file(st: os.stat_result) -> Optional[ModuleType]:
+    # module loaded from the same unchanged file, if registry is enabled
+    registry = _file_registry
+    if registry is None:
+        return None
+    with _file_registry_lock:
+        modobj = registry.get((st.st_dev, st.st_ino, st.st_mtime_ns))
+    if modobj is None or sys.modules.get(modobj.__name__) is not modobj:
+        return None  # unloaded or rolled back
+    fingerprint = getattr(modobj, '__importloc_fingerprint__', None)
+    if fingerprint is None or fingerprint.mtime_ns != st.st_mtime_ns:
+        return None  # reloaded from changed file
+    return modobj
+
+
+def register_file(st: os.stat_result, modobj: ModuleType) -> None:
+    registry = _file_registry
+    if registry is not None:
+        with _file_registry_lock:
+            registry[st.st_dev, st.st_ino, st.st_mtime_ns] = modobj
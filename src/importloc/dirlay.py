@@ -1,8 +1,12 @@
 from dataclasses import dataclass
+import hashlib
 import os
 from pathlib import Path
+import shutil
+import sys
 from tempfile import TemporaryDirectory
-from typing import Optional, Tuple, Union
+from threading import Lock
+from typing import Any, Iterable, Literal, Optional, Tuple, Union
 
 
 @dataclass
@@ -15,6 +19,13 @@ class File:
 class DirectoryLayout:
     files: Tuple[File, ...]
     chdir: Union[str, Path] = Path('.')
+    # 'write' writes all files on each create(); other modes write the tree once
+    # per process into shared template directory, keyed by files content hash,
+    # and populate each new layout from it:
+    # * 'copy' copies files
+    # * 'hardlink' links files; layout files must not be modified in place
+    # * 'clone' makes copy-on-write clones where supported, otherwise copies
+    mode: Literal['write', 'copy', 'hardlink', 'clone'] = 'write'
 
     def __post_init__(self) -> None:
         self._tempdir: Optional[TemporaryDirectory[str]] = None
@@ -22,10 +33,19 @@ class DirectoryLayout:
 
     def create(self) -> None:
         self._tempdir = TemporaryDirectory()
-        for f in self.files:
-            p = Path(self._tempdir.name) / f.path
-            p.parent.mkdir(parents=True, exist_ok=True)
-            p.write_text(f.text)
+        if self.mode == 'write':
+            self.write_files(self.files)
+        else:
+            template = get_template(self.files)
+            copy = _COPY_FUNCTIONS[self.mode]
+            shutil.copytree(
+                template, self._tempdir.name, copy_function=copy, dirs_exist_ok=True
+            )
+
+    def write_files(self, files: Iterable[File]) -> None:
+        if self._tempdir is None:
+            raise RuntimeError('Directory layout must be created first')
+        write_files(self._tempdir.name, files)
 
     def pushd(self) -> None:
         self._oldcwd = os.getcwd()
@@ -48,3 +68,75 @@ class DirectoryLayout:
             raise RuntimeError('Directory layout already destroyed')
         self._tempdir.cleanup()
         self._tempdir = None
+
+    def __enter__(self) -> 'DirectoryLayout':
+        self.create()
+        try:
+            self.pushd()
+        except BaseException:
+            self.destroy()
+            raise
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        try:
+            if self._oldcwd is not None:
+                self.popd()
+        finally:
+            self.destroy()
+
+
+def write_files(root: str, files: Iterable[File]) -> None:
+    # create each directory once, and write files without pathlib overhead
+    created: set[str] = set()
+    for f in files:
+        path = os.path.join(root, f.path)
+        parent = os.path.dirname(path)
+        if parent not in created:
+            os.makedirs(parent, exist_ok=True)
+            created.add(parent)
+        with open(path, 'w') as fp:
+            fp.write(f.text)
+
+
+_templates: dict[str, 'TemporaryDirectory[str]'] = {}
+_templates_lock = Lock()
+
+
+def get_template(files: Tuple[File, ...]) -> str:
+    # template directories are removed when the interpreter exits
+    digest = hashlib.blake2b(digest_size=16)
+    for f in files:
+        for part in (f.path, f.text):
+            data = part.encode()
+            digest.update(len(data).to_bytes(8, 'little'))
+            digest.update(data)
+    key = digest.hexdigest()
+    with _templates_lock:
+        template = _templates.get(key)
+        if template is None:
+            template = TemporaryDirectory(prefix='importloc-template-')
+            write_files(template.name, files)
+            _templates[key] = template
+    return template.name
+
+
+def clone_file(src: str, dst: str, *args: Any, **kwargs: Any) -> None:
+    if sys.platform.startswith('linux'):
+        import fcntl
+
+        FICLONE = 0x40049409
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass  # file system does not support cloning, fall back to copy
+    shutil.copy2(src, dst)
+
+
+_COPY_FUNCTIONS: dict[str, Any] = {
+    'copy': shutil.copy2,
+    'hardlink': os.link,
+    'clone': clone_file,
+}
@@ -0,0 +1,228 @@
+from threading import Lock
+from time import perf_counter
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+
+
+if TYPE_CHECKING:
+    from .location import Location
+
+
+class LoadEvent(NamedTuple):
+    """
+    Timing of location parsing or loading, passed to `subscribe` callbacks.
+
+    Phases are reported in the order they were executed:
+
+    * ``parse`` --- location specification string parsing (reported as separate
+      event with ``modname`` equal to `None`)
+    * ``resolve`` --- module name resolution, including conflict resolution and
+      waiting for concurrent loads of the same module name
+    * ``validate`` --- location validation, e.g. file path checks
+    * ``spec`` --- module spec and module object creation (`PathLocation` only)
+    * ``exec`` --- module execution; for `ModuleLocation` includes finding module
+    * ``getattr`` --- object lookup in loaded module
+    """
+
+    #: Parsed or loaded location.
+    location: 'Location'
+    #: Module name, `None` for ``parse`` events.
+    modname: Optional[str]
+    #: Duration of each executed phase, in seconds.
+    phases: dict[str, float]
+    #: Loaded module, if load was successful.
+    module: Optional[ModuleType] = None
+    #: Exception raised, if any.
+    error: Optional[BaseException] = None
+    #: Whether already imported module was re-executed by ``reload`` or
+    #: ``reload_if_changed`` conflict resolution.
+    reloaded: bool = False
+
+    @property
+    def duration(self) -> float:
+        """
+        Total duration of all phases, in seconds.
+        """
+        return sum(self.phases.values())
+
+
+Subscriber = Callable[[LoadEvent], None]
+
+_subscribers: list[Subscriber] = []
+_subscribers_lock = Lock()
+
+
+def subscribe(callback: Subscriber) -> None:
+    """
+    Call ``callback`` with `LoadEvent` after each location is parsed or loaded,
+    successfully or not. Callbacks are called on the thread that performed loading.
+
+    When there are no subscribers, timings are not collected at all.
+
+    Args:
+        callback (``Callable[[LoadEvent], None]``):
+            callable to be called; exceptions raised by callback are propagated
+            to the caller of `Location.load() <importloc.location.Location.load>`.
+
+    Example:
+        >>> subscribe(lambda e: print(e.location, e.duration))
+    """
+    with _subscribers_lock:
+        _subscribers.append(callback)
+
+
+def unsubscribe(callback: Subscriber) -> None:
+    """
+    Stop calling ``callback`` subscribed with `subscribe`.
+
+    Raises:
+        `ValueError`: when ``callback`` is not subscribed.
+    """
+    with _subscribers_lock:
+        _subscribers.remove(callback)
+
+
+def emit(event: LoadEvent) -> None:
+    for callback in tuple(_subscribers):
+        callback(event)
+
+
+class PhaseTimer:
+    # created by loading code only when there are subscribers
+
+    __slots__ = ('phases', '_last')
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self._last = perf_counter()
+
+    def mark(self, phase: str) -> None:
+        now = perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+
+class PhaseStats(NamedTuple):
+    """
+    Aggregated timings reported by `LoadStats`.
+    """
+
+    #: Location specification string, or `None` when aggregated by phase only.
+    location: Optional[str]
+    #: Phase name, or ``total`` for whole load duration.
+    phase: str
+    #: Number of measurements.
+    calls: int
+    #: Total duration, in seconds.
+    total: float
+    #: Median duration, in seconds.
+    p50: float
+    #: 99th percentile of duration, in seconds.
+    p99: float
+
+
+class LoadStats:
+    """
+    In-process aggregator of `LoadEvent` timings.
+
+    Use as context manager to subscribe for the duration of the block, or call
+    `start` and `stop` explicitly.
+
+    Example:
+        >>> with LoadStats() as stats:
+        ...     app = Location('app/main.py:app').load()
+        >>> print(stats.report())
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[tuple[str, str], list[float]] = {}
+        self._lock = Lock()
+
+    def __call__(self, event: LoadEvent) -> None:
+        spec = event.location.spec
+        with self._lock:
+            for phase, duration in event.phases.items():
+                self._data.setdefault((spec, phase), []).append(duration)
+            if event.modname is not None:
+                total = self._data.setdefault((spec, 'total'), [])
+                total.append(event.duration)
+
+    def start(self) -> None:
+        """
+        Subscribe to load events.
+        """
+        subscribe(self)
+
+    def stop(self) -> None:
+        """
+        Unsubscribe from load events.
+        """
+        unsubscribe(self)
+
+    def clear(self) -> None:
+        """
+        Remove all collected timings.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def by_location(self) -> list[PhaseStats]:
+        """
+        Get statistics for each location and phase, sorted by location and total
+        duration of the phase, descending.
+        """
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._data.items()]
+        stats = [_stats(spec, phase, values) for (spec, phase), values in items]
+        return sorted(stats, key=lambda s: (s.location, -s.total))
+
+    def by_phase(self) -> list[PhaseStats]:
+        """
+        Get statistics for each phase across all locations, sorted by total duration
+        of the phase, descending.
+        """
+        phases: dict[str, list[float]] = {}
+        with self._lock:
+            for (_, phase), values in self._data.items():
+                phases.setdefault(phase, []).extend(values)
+        stats = [_stats(None, phase, values) for phase, values in phases.items()]
+        return sorted(stats, key=lambda s: -s.total)
+
+    def report(self) -> str:
+        """
+        Format statistics by phase and by location as plain text table.
+        """
+        header = f'{"location":40} {"phase":8} {"calls":>6} '
+        header += f'{"total,ms":>10} {"p50,ms":>9} {"p99,ms":>9}'
+        lines = [header]
+        for s in (*self.by_phase(), *self.by_location()):
+            lines.append(
+                f'{s.location or "*":40} {s.phase:8} {s.calls:>6} '
+                f'{s.total * 1e3:>10.3f} {s.p50 * 1e3:>9.3f} {s.p99 * 1e3:>9.3f}'
+            )
+        return '\n'.join(lines)
+
+    def __enter__(self) -> 'LoadStats':
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+
+def _stats(location: Optional[str], phase: str, values: list[float]) -> PhaseStats:
+    values = sorted(values)
+    return PhaseStats(
+        location,
+        phase,
+        len(values),
+        sum(values),
+        _percentile(values, 50),
+        _percentile(values, 99),
+    )
+
+
+def _percentile(values: list[float], p: int) -> float:
+    # nearest-rank method on sorted values
+    rank = max(1, -(-len(values) * p // 100))
+    return values[rank - 1]
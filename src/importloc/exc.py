@@ -1,11 +1,40 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
+
+
+if TYPE_CHECKING:
+    from .location import Location
 
 
 class InvalidLocation(ValueError):
     """
     Incorrect format of location specification string.
+
+    Attributes:
+        spec (``str``):
+            invalid location specification string.
+        lineno (``int`` | ``None``):
+            1-based position of ``spec`` in the input of
+            `Location.parse_many() <importloc.location.Location.parse_many>`,
+            otherwise `None`.
     """
 
+    def __init__(self, spec: Any, lineno: Optional[int] = None) -> None:
+        self.spec = spec
+        self.lineno = lineno
+        super().__init__(spec)
+
+
+class ModuleLockDeadlock(ImportError):
+    """
+    Module cannot be loaded, because its name is locked by another thread that is
+    waiting, directly or indirectly, for a module being loaded by this thread, e.g.
+    when two threads load modules that load each other.
+    """
+
+    def __init__(self, modname: str, *args: Any, **kwargs: Any) -> None:
+        msg = f'Deadlock detected when locking module "{modname}"'
+        super().__init__(msg, *args, **kwargs)
+
 
 class ModuleNameConflict(ImportError):
     """
@@ -15,3 +44,25 @@ class ModuleNameConflict(ImportError):
     def __init__(self, modname: str, *args: Any, **kwargs: Any) -> None:
         msg = f'Module "{modname}" is already imported'
         super().__init__(msg, *args, **kwargs)
+
+
+class LoadManyError(ImportError):
+    """
+    One or more locations passed to `~importloc.batch.load_many` failed to load.
+
+    Attributes:
+        errors (``list[tuple[Location, Exception]]``):
+            failed locations with corresponding exceptions, in input order.
+        results (``dict[Location, object]``):
+            objects loaded successfully.
+    """
+
+    def __init__(
+        self,
+        errors: 'list[tuple[Location, Exception]]',
+        results: 'dict[Location, object]',
+    ) -> None:
+        self.errors = errors
+        self.results = results
+        total = len(errors) + len(results)
+        super().__init__(f'{len(errors)} of {total} locations failed to load')
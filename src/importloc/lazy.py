@@ -0,0 +1,119 @@
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+
+if TYPE_CHECKING:
+    from .location import Location
+
+
+_UNRESOLVED = object()
+
+
+class LazyObject:
+    """
+    Proxy for the object to be loaded from location on first use, returned by
+    `Location.load(lazy=True) <importloc.location.Location.load>`.
+
+    Module import, module name conflict resolution, atomic rollback, and nested
+    object lookup are deferred until the first attribute access, call, or other
+    operation on the proxy; errors are raised at that moment too. If loading fails,
+    it will be retried on next access.
+
+    Proxy object is not the target object itself, e.g. ``isinstance`` checks are not
+    forwarded; use `unwrap` to get the target object.
+
+    Example:
+        >>> cli = Location('app.commands.db:cli').load(lazy=True)
+        >>> cli
+        <LazyObject <ModuleLocation 'app.commands.db' obj='cli'>>
+        >>> cli()  # import happens here
+    """
+
+    __slots__ = (
+        '_importloc_loc',
+        '_importloc_load',
+        '_importloc_lock',
+        '_importloc_obj',
+    )
+
+    def __init__(self, loc: 'Location', load: Callable[[], object]) -> None:
+        object.__setattr__(self, '_importloc_loc', loc)
+        object.__setattr__(self, '_importloc_load', load)
+        object.__setattr__(self, '_importloc_lock', RLock())
+        object.__setattr__(self, '_importloc_obj', _UNRESOLVED)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_target(self), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(_target(self), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(_target(self), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return _target(self)(*args, **kwargs)
+
+    def __dir__(self) -> Iterator[str]:
+        return iter(dir(_target(self)))
+
+    def __repr__(self) -> str:
+        obj = object.__getattribute__(self, '_importloc_obj')
+        if obj is _UNRESOLVED:
+            loc = object.__getattribute__(self, '_importloc_loc')
+            return f'<{self.__class__.__name__} {loc!r}>'
+        return repr(obj)
+
+    def __str__(self) -> str:
+        return str(_target(self))
+
+    def __bool__(self) -> bool:
+        return bool(_target(self))
+
+    def __eq__(self, other: object) -> bool:
+        return bool(_target(self) == other)
+
+    def __hash__(self) -> int:
+        return hash(_target(self))
+
+    def __len__(self) -> int:
+        return len(_target(self))
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(_target(self))
+
+    def __contains__(self, item: object) -> bool:
+        return item in _target(self)
+
+    def __getitem__(self, key: Any) -> Any:
+        return _target(self)[key]
+
+
+def unwrap(obj: object) -> object:
+    """
+    Get target object of `LazyObject` proxy, loading it if needed. Other objects are
+    returned unchanged.
+
+    Args:
+        obj (``object``):
+            lazy proxy or any other object.
+
+    Raises:
+        `Exception`: any exception raised by `Location.load()
+            <importloc.location.Location.load>`.
+    """
+    if not isinstance(obj, LazyObject):
+        return obj
+    target = object.__getattribute__(obj, '_importloc_obj')
+    if target is not _UNRESOLVED:
+        return target
+    with object.__getattribute__(obj, '_importloc_lock'):
+        target = object.__getattribute__(obj, '_importloc_obj')
+        if target is _UNRESOLVED:
+            target = object.__getattribute__(obj, '_importloc_load')()
+            object.__setattr__(obj, '_importloc_obj', target)
+    return target
+
+
+def _target(proxy: LazyObject) -> Any:
+    return unwrap(proxy)
@@ -1,7 +1,7 @@
 r"""
 To use any of supported concrete location types, use *generic* `Location` class.
 Upon construction, it will return one of *specific* location objects supported:
-`ModuleLocation` or `PathLocation`. Alternatively, construct *specific* location types
+`ModuleLocation`, `ZipLocation` or `PathLocation`. Alternatively, construct *specific* location types
 directly to enforce corresponding location type.
 
 .. list-table::
@@ -11,9 +11,14 @@ directly to enforce corresponding location type.
     * - Location
       - Format
     * - `PathLocation`
-      - ``(?P<path>.*/[^/]*\.py)(:(?P<obj>[^./:]+(?:\.[^./:]+)*))?``
+      - ``(?P<path>.*/[^/]*\.pyc?)(:(?P<obj>OBJ))?``
+    * - `ZipLocation`
+      - ``(?P<archive>[^:]*?\.zip)/(?P<member>[^:]*\.py)(:(?P<obj>OBJ))?``
     * - `ModuleLocation`
-      - ``(?P<module>[^./:]+(?:\.[^./:]+)*)(:(?P<obj>[^./:]+(?:\.[^./:]+)*))?``
+      - ``(?P<module>[^./:]+(?:\.[^./:]+)*)(:(?P<obj>OBJ))?``
+
+where ``OBJ`` is either single dot-separated object name ``[^./:{},]+(?:\.[^./:{},]+)*``,
+or comma-separated list of such names in curly braces, e.g. ``{User,Group,Role.Meta}``.
 
 .. list-table::
     :header-rows: 1
@@ -22,9 +27,13 @@ directly to enforce corresponding location type.
     * - Location
       - Examples
     * - `PathLocation`
-      - ``svc1/main.py:app``, ``svc1/exceptions.py``, ``../config.py``
+      - ``svc1/main.py:app``, ``svc1/exceptions.py``, ``../config.py``,
+        ``build/main.cpython-312.pyc:app``
+    * - `ZipLocation`
+      - ``bundle.zip/app/main.py:app``, ``../plugins.zip/plugin.py``
     * - `ModuleLocation`
-      - ``app.__main__:cli``, ``logging:StreamHandler``
+      - ``app.__main__:cli``, ``logging:StreamHandler``,
+        ``app.models:{User,Group,Role.Meta}``
 
 .. raw:: html
     :file: ../../docs/_static/classes-dark.svg
@@ -36,24 +45,66 @@ directly to enforce corresponding location type.
 """
 
 from abc import ABC
-from contextlib import contextmanager
+import asyncio
+from concurrent.futures import Executor
+from contextlib import ExitStack, asynccontextmanager, contextmanager
 from enum import Enum
+from functools import lru_cache, partial
+import importlib.abc
 import importlib.util
-from importlib.machinery import ModuleSpec
-from pathlib import Path
+from importlib.machinery import ModuleSpec, SourceFileLoader, SourcelessFileLoader
+import os
+from pathlib import Path, PurePosixPath
 import re
+import stat
 import sys
-from types import ModuleType
-from typing import Any, Callable, Iterable, Literal, Optional, Tuple, TypeVar, Union
+import threading
+from types import CodeType, ModuleType
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakValueDictionary
+import zipfile
 
 from typing_extensions import Self, override
 
-from .exc import InvalidLocation, ModuleNameConflict
-from .util import getattr_nested
-
+from .cache import (
+    MISSING,
+    CacheInfo,
+    Fingerprint,
+    file_digest,
+    get_code_cache,
+    get_object_cache,
+    lookup_file,
+    register_file,
+    resolve_path,
+)
+from .events import LoadEvent, PhaseTimer, _subscribers, emit
+from .exc import InvalidLocation, ModuleLockDeadlock, ModuleNameConflict
+from .lazy import LazyObject
+from .util import compile_getter
+
+
+_object_cache = get_object_cache()
 
 _OBJ = r'[^./:]+(?:\.[^./:]+)*'
-_PYPATH = r'.*/[^/]*\.py'
+_ATTR = r'[^./:{},]+(?:\.[^./:{},]+)*'
+_OBJS = rf'(?:{_ATTR}|\{{\s*{_ATTR}(?:\s*,\s*{_ATTR})*\s*\}})'
+_PYPATH = r'.*/[^/]*\.pyc?'
+_ZIPPATH = r'[^:]*?\.zip'
+_MEMBER = r'[^:]*\.py'
 
 
 class ConflictResolution(str, Enum):
@@ -65,6 +116,12 @@ class ConflictResolution(str, Enum):
     REUSE = 'reuse'
     #: Don't import again, apply `importlib.reload` to existing module in `sys.modules`.
     RELOAD = 'reload'
+    #: Like `RELOAD`, but re-execute existing module only when its source file
+    #: fingerprint (``mtime_ns``, size, and content hash if needed) has changed
+    #: since the module was loaded or reloaded with `importloc`. Whether the module
+    #: was re-executed is reported as `LoadEvent.reloaded
+    #: <importloc.events.LoadEvent.reloaded>`, or use `reload` directly.
+    RELOAD_IF_CHANGED = 'reload_if_changed'
     #: Delete existing module and use the imported one.
     REPLACE = 'replace'
     #: Retry module import with new generated name, and raise
@@ -75,28 +132,86 @@ class ConflictResolution(str, Enum):
 
 
 class Location(ABC):
+    __slots__ = ('spec', 'obj', 'objs', '_hash')
+
     spec: str
     obj: Optional[str]
+    #: Object names for multi-object specification ``{A,B.C}``, otherwise `None`.
+    objs: Optional[Tuple[str, ...]]
+    _hash: int
 
-    def __new__(cls, spec: Union[str, Path]) -> Union['ModuleLocation', 'PathLocation']:  # type: ignore[misc]
+    def __new__(  # type: ignore[misc]
+        cls, spec: Union[str, Path]
+    ) -> Union['ModuleLocation', 'PathLocation', 'ZipLocation']:
         """
-        __init__(self, spec: str) -> Union[ModuleLocation, PathLocation]
+        __init__(self, spec: str) -> Union[ModuleLocation, PathLocation, ZipLocation]
 
         Arbitrary importable location.
 
+        Location objects are immutable, hashable and compare equal by value. Objects
+        parsed from identical specification strings are cached and shared, see
+        `Location.parse_cache_info`.
+
         :param spec:
             location specification string.
 
         :raises InvalidLocation:
             when location string format is incorrect.
         """
-        for loctype in cls._types(spec):
-            if isinstance(spec, Path) and not spec.is_absolute():
-                spec = f'./{spec}'
-            match = loctype.match(str(spec))
-            if match:
-                return loctype(**match.groupdict())
-        raise InvalidLocation(spec)
+        if isinstance(spec, str):
+            return parse_location(spec, None)
+        elif isinstance(spec, Path):
+            pathspec = str(spec) if spec.is_absolute() else f'./{spec}'
+            if PathLocation.match(pathspec) is None:
+                raise InvalidLocation(spec)
+            return PathLocation(spec)
+        else:
+            raise TypeError(f'Unexpected spec type {type(spec)}')
+
+    @staticmethod
+    def parse_cache_info() -> CacheInfo:
+        """
+        Get statistics of location specification strings cache.
+        """
+        info = parse_spec.cache_info()
+        return CacheInfo(info.hits, info.misses, PARSE_CACHE_SIZE, info.currsize)
+
+    @staticmethod
+    def parse_many(
+        specs: Iterable[str],
+    ) -> Iterator[
+        Union['ModuleLocation', 'PathLocation', 'ZipLocation', InvalidLocation]
+    ]:
+        """
+        Parse location specification strings one by one, e.g. lines of a file.
+
+        Surrounding whitespace is stripped, and empty strings are skipped. Instead of
+        raising on invalid specification string, `InvalidLocation` exception object
+        is yielded in its place, with ``lineno`` attribute set to 1-based position
+        of the string in ``specs``.
+
+        :param specs:
+            iterable of location specification strings.
+
+        :return:
+            iterator over location objects and `InvalidLocation` errors, in input
+            order.
+        """
+        for lineno, line in enumerate(specs, 1):
+            spec = line.strip()
+            if not spec:
+                continue
+            try:
+                yield parse_location(spec, None)
+            except InvalidLocation:
+                yield InvalidLocation(spec, lineno)
+
+    @staticmethod
+    def parse_cache_clear() -> None:
+        """
+        Clear location specification strings cache.
+        """
+        parse_spec.cache_clear()
 
     @classmethod
     def match(cls, spec: str) -> Optional[re.Match[str]]:
@@ -114,6 +229,10 @@ class Location(ABC):
         modname: Union[str, Callable[[Self], str], None] = None,
         on_conflict: Union[ConflictResolution, str] = 'raise',
         rename: Optional[Callable[[str, Self], str]] = None,
+        *,
+        lazy: bool = False,
+        cache: bool = False,
+        transaction: bool = False,
     ) -> Union[object, ModuleType]:
         """
         Import requested object or the whole module object from location.
@@ -139,28 +258,282 @@ class Location(ABC):
             ``on_conflict`` is ``rename``; first string argument is ``modname``
             that leads to conflict, second argument is current `Location`.
 
+        :param lazy:
+            if `True`, return `~importloc.lazy.LazyObject` proxy immediately, and
+            defer loading until the proxy is used for the first time; all errors
+            are deferred too.
+
+        :param cache:
+            if `True`, cache returned object by ``(location, modname)``, and return
+            cached object on subsequent calls while the module remains in
+            `sys.modules` and is not reloaded or unloaded by `importloc`; requires
+            ``on_conflict='reuse'``, and ``modname`` to be `str` or `None`.
+
+        :param transaction:
+            if `True`, on import error also remove all modules imported in the
+            current thread while loading, e.g. dependencies and submodules imported
+            by the failed module, and restore replaced ones.
+
         :raises TypeError | ValueError:
-            when passed arguments of wrong type.
+            when passed arguments of wrong type or incompatible arguments.
         :raises ModuleNameConflict:
             see `ConflictResolution` for details.
         :raises Exception:
             see specific location classes.
 
         :return:
-            `object` when ``obj`` part was specified, otherwise `~types.ModuleType`.
+            `object` when ``obj`` part was specified, `tuple` of objects when
+            multiple objects ``{A,B}`` were specified, otherwise `~types.ModuleType`.
         """
         raise NotImplementedError
 
+    async def aload(
+        self,
+        modname: Union[str, Callable[[Self], str], None] = None,
+        on_conflict: Union[ConflictResolution, str] = 'raise',
+        rename: Optional[Callable[[str, Self], str]] = None,
+        *,
+        cache: bool = False,
+        transaction: bool = False,
+        executor: Optional[Executor] = None,
+        exec_in_executor: bool = False,
+    ) -> Union[object, ModuleType]:
+        """
+        Asynchronous version of `load`, that does not block the event loop on file
+        system access and compilation.
+
+        Module file is located, read and compiled in ``executor``; only module code
+        execution runs on the event loop, unless ``exec_in_executor`` is `True`.
+        Module that is already imported and is not going to be executed again, e.g.
+        with ``on_conflict='reuse'``, is not read and compiled.
+        Module lock is awaited without blocking the event loop. Concurrent tasks
+        loading the same module file share a single read and compilation; tasks
+        awaiting calls with the same location and arguments share a single load
+        and get the same result or exception.
+
+        :param modname:
+            see `load`.
+        :param on_conflict:
+            see `load`.
+        :param rename:
+            see `load`.
+        :param cache:
+            see `load`.
+        :param transaction:
+            see `load`.
+
+        :param executor:
+            `concurrent.futures.Executor` to run blocking operations in; by default,
+            event loop default executor is used.
+
+        :param exec_in_executor:
+            if `True`, execute module code in ``executor`` too, e.g. when module
+            performs blocking operations on import.
+
+        :raises Exception:
+            same as `load`.
+
+        :return:
+            `object` when ``obj`` part was specified, `tuple` of objects when
+            multiple objects ``{A,B}`` were specified, otherwise `~types.ModuleType`.
+        """
+        loop = asyncio.get_running_loop()
+        key = (
+            loop,
+            self,
+            modname,
+            ConflictResolution(on_conflict),
+            rename,
+            cache,
+            transaction,
+            executor,
+            exec_in_executor,
+        )
+        future = _inflight.get(key)
+        if future is None:
+            future = loop.create_task(
+                self._aload(
+                    loop,
+                    modname,
+                    on_conflict,
+                    rename,
+                    cache,
+                    transaction,
+                    executor,
+                    exec_in_executor,
+                )
+            )
+            _inflight[key] = future
+            future.add_done_callback(lambda _: _inflight.pop(key, None))
+        # cancelling one of the waiting tasks should not cancel shared load
+        return await asyncio.shield(future)
+
     # internal helpers
 
-    @staticmethod
-    def _types(spec: Any) -> list[Union[type['ModuleLocation'], type['PathLocation']]]:
-        if isinstance(spec, str):
-            return [ModuleLocation, PathLocation]
-        elif isinstance(spec, Path):
-            return [PathLocation]
+    def _load(
+        self,
+        modname: Union[str, Callable[[Self], str], None],
+        on_conflict: Union[ConflictResolution, str],
+        rename: Optional[Callable[[str, Self], str]],
+        cache: bool = False,
+        transaction: bool = False,
+        prepare: Optional[Callable[[], Optional['PreparedFile']]] = None,
+    ) -> Union[object, ModuleType]:
+        if cache:
+            obj = self._cached(modname, on_conflict)
+            if obj is not MISSING:
+                return obj
+        timer = PhaseTimer() if _subscribers else None
+        name = get_module_name(self._default_modname(), modname, self)
+        try:
+            with module_lock(name):
+                # conflict is resolved and module is imported while holding the lock,
+                # concurrent loads of the same module name are serialized
+                name, action, reloaded = resolve_conflict(
+                    name, on_conflict, rename, self
+                )
+                if timer is not None:
+                    timer.mark('resolve')
+                prepared = self._prepare() if prepare is None else prepare()
+                if timer is not None:
+                    timer.mark('validate')
+                with atomic_import(name, transaction):
+                    modobj = self._import(name, action, prepared, timer)
+                    obj = self._get_obj(modobj)
+                    if timer is not None:
+                        timer.mark('getattr')
+        except BaseException as exc:
+            if timer is not None:
+                emit(LoadEvent(self, name, timer.phases, None, exc))
+            raise
+        if cache:
+            _object_cache.put((self, modname), name, modobj, obj)
+        if timer is not None:
+            emit(LoadEvent(self, name, timer.phases, modobj, None, reloaded))
+        return obj
+
+    async def _aload(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        modname: Union[str, Callable[[Self], str], None],
+        on_conflict: Union[ConflictResolution, str],
+        rename: Optional[Callable[[str, Self], str]],
+        cache: bool,
+        transaction: bool,
+        executor: Optional[Executor],
+        exec_in_executor: bool,
+    ) -> Union[object, ModuleType]:
+        if cache:
+            obj = self._cached(modname, on_conflict)
+            if obj is not MISSING:
+                return obj
+        name = get_module_name(self._default_modname(), modname, self)
+        if callable(modname):
+            modname = name  # call it once
+        # compile only if module is going to be executed, e.g. not when reused;
+        # conflict is resolved again by _load while holding module lock
+        compile = name not in sys.modules or ConflictResolution(on_conflict) in (
+            ConflictResolution.REPLACE,
+            ConflictResolution.RENAME,
+        )
+        prepared = await self._aprepare(loop, executor, compile)
+        load = partial(
+            self._load,
+            modname,
+            on_conflict,
+            rename,
+            cache,
+            transaction,
+            prepare=lambda: prepared,
+        )
+        if exec_in_executor:
+            return await loop.run_in_executor(executor, load)
+        # module lock is acquired without blocking the event loop; the lock is
+        # reentrant, and there are no awaits until it is released, so _load
+        # acquires it again immediately
+        async with amodule_lock(name):
+            return load()
+
+    async def _aprepare(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        executor: Optional[Executor],
+        compile: bool,
+    ) -> Optional['PreparedFile']:
+        # concurrent loads of the same module share single prepare and compile
+        key = (loop, self._source(), executor, compile)
+        future = _inflight_prepare.get(key)
+        if future is None:
+            future = loop.run_in_executor(executor, self._prepare, compile)
+            _inflight_prepare[key] = future
+            future.add_done_callback(lambda _: _inflight_prepare.pop(key, None))
+        return await asyncio.shield(future)
+
+    def _cached(
+        self,
+        modname: Union[str, Callable[[Self], str], None],
+        on_conflict: Union[ConflictResolution, str],
+    ) -> object:
+        # validate cache arguments, return cached object or MISSING
+        if on_conflict != ConflictResolution.REUSE:
+            raise ValueError('cache requires on_conflict="reuse"')
+        if not (modname is None or isinstance(modname, str)):
+            raise ValueError('cache requires modname to be str or None')
+        return _object_cache.get((self, modname))
+
+    def _default_modname(self) -> str:
+        raise NotImplementedError
+
+    def _source(self) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    def _prepare(self, compile: bool = False) -> Optional['PreparedFile']:
+        raise NotImplementedError
+
+    def _import(
+        self,
+        modname: str,
+        action: Literal['use', 'import'],
+        prepared: Optional['PreparedFile'],
+        timer: Optional[PhaseTimer] = None,
+    ) -> ModuleType:
+        raise NotImplementedError
+
+    def _key(self) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    def _set_obj(self, obj: Optional[str]) -> None:
+        objs = None
+        if obj is not None and obj.startswith('{'):
+            objs = tuple(o.strip() for o in obj.strip('{}').split(','))
+            obj = '{' + ','.join(objs) + '}'
+        object.__setattr__(self, 'obj', obj)
+        object.__setattr__(self, 'objs', objs)
+
+    def _get_obj(self, modobj: ModuleType) -> object:
+        if self.obj is None:
+            return modobj
+        elif self.objs is None:
+            return compile_getter(self.obj)(modobj)
         else:
-            raise TypeError(f'Unexpected spec type {type(spec)}')
+            return tuple(compile_getter(o)(modobj) for o in self.objs)
+
+    def _freeze(self) -> None:
+        object.__setattr__(self, '_hash', hash((self.__class__, *self._key())))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} object is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self.__class__.__name__} object is immutable')
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return self._hash
 
     # error helpers with unified error messages
 
@@ -185,12 +558,28 @@ class ModuleLocation(Location):
     Package-based importable location, e.g. ``foo.bar:obj``
     """
 
+    __slots__ = ('module',)
+
     module: str
-    RX = re.compile(rf'^(?P<module>{_OBJ})(?::(?P<obj>{_OBJ}))?$')
+    RX = re.compile(rf'^(?P<module>{_OBJ})(?::(?P<obj>{_OBJS}))?$')
 
     # bypass Location.__new__
-    def __new__(cls, *args: Any, **kwargs: Any) -> 'ModuleLocation':
-        return object.__new__(cls)
+    def __new__(
+        cls,
+        spec: Optional[str] = None,
+        *,
+        module: Optional[str] = None,
+        obj: Optional[str] = None,
+    ) -> 'ModuleLocation':
+        if spec is None:
+            if module is None:
+                raise cls._arg_required_with_no_spec('module')
+            spec = module if obj is None else f'{module}:{obj}'
+            return cls._create(spec, module, obj)
+        else:
+            if module is not None or obj is not None:
+                raise cls._args_denied_with_spec()
+            return parse_location(spec, cls)  # type: ignore[return-value]
 
     def __init__(
         self,
@@ -208,29 +597,35 @@ class ModuleLocation(Location):
             importable module name; required, if ``spec`` is not passed.
 
         :param obj:
-            dot-separated object name to be imported; when missing, the whole module
-            will be loaded
+            dot-separated object name to be imported, or comma-separated names in
+            curly braces, e.g. ``{A,B.C}``; when missing, the whole module will be
+            loaded
 
         :raises ValueError:
             when passed incorrect arguments.
         :raises InvalidLocation:
             when location string format is incorrect.
         """
-        if spec is None:
-            if module is None:
-                raise self._arg_required_with_no_spec('module')
-            self.module = module
-            self.obj = obj
-            self.spec = module if self.obj is None else f'{self.module}:{self.obj}'
-        else:
-            if module is not None or obj is not None:
-                raise self._args_denied_with_spec()
-            match = self.match(spec)
-            if match is None:
-                raise InvalidLocation(spec)
-            self.spec = spec
-            self.module = match.group('module')
-            self.obj = match.groupdict().get('obj', None)
+        # immutable object is completely initialized in __new__
+
+    @classmethod
+    def _create(cls, spec: str, module: str, obj: Optional[str]) -> Self:
+        self = object.__new__(cls)
+        object.__setattr__(self, 'spec', spec)
+        object.__setattr__(self, 'module', module)
+        self._set_obj(obj)
+        self._freeze()
+        return self
+
+    @classmethod
+    def _from_match(cls, spec: str, match: re.Match[str]) -> Self:
+        return cls._create(spec, match.group('module'), match.group('obj'))
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.module, self.obj)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self._create, (self.spec, self.module, self.obj))
 
     @classmethod
     def match(cls, spec: str) -> Optional[re.Match[str]]:
@@ -248,6 +643,10 @@ class ModuleLocation(Location):
         modname: Union[str, Callable[[Self], str], None] = None,
         on_conflict: Union[ConflictResolution, str] = 'raise',
         rename: Optional[Callable[[str, Self], str]] = None,
+        *,
+        lazy: bool = False,
+        cache: bool = False,
+        transaction: bool = False,
     ) -> Union[object, ModuleType]:
         """
         Import requested object or the whole module object from importable module.
@@ -272,8 +671,24 @@ class ModuleLocation(Location):
             ``on_conflict`` is ``rename``; first string argument is ``modname`` that
             leads to conflict, second argument is current `Location`.
 
+        :param lazy:
+            if `True`, return `~importloc.lazy.LazyObject` proxy immediately, and
+            defer loading until the proxy is used for the first time; all errors
+            are deferred too.
+
+        :param cache:
+            if `True`, cache returned object by ``(location, modname)``, and return
+            cached object on subsequent calls while the module remains in
+            `sys.modules` and is not reloaded or unloaded by `importloc`; requires
+            ``on_conflict='reuse'``, and ``modname`` to be `str` or `None`.
+
+        :param transaction:
+            if `True`, on import error also remove all modules imported in the
+            current thread while loading, e.g. dependencies and submodules imported
+            by the failed module, and restore replaced ones.
+
         :raises TypeError | ValueError:
-            when passed arguments of wrong type.
+            when passed arguments of wrong type or incompatible arguments.
         :raises ModuleNameConflict:
             see `ConflictResolution` for details.
         :raises ModuleNotFoundError:
@@ -281,37 +696,63 @@ class ModuleLocation(Location):
         :raises ImportError:
             when module import fails.
         :raises AttributeError:
-            when ``obj`` name can't be found in imported module.
+            when ``obj`` name can't be found in imported module; if any of multiple
+            objects can't be found, newly imported module is rolled back.
 
         :return:
-            `object` when ``obj`` part was specified, otherwise `~types.ModuleType`.
-        """
-        modname, action = resolve_module_name(
-            default=self.module,
-            override=modname,
-            on_conflict=on_conflict,
-            rename=rename,
-            loc=self,
-        )
-        # process
-        with atomic_import(modname):
-            # import module
-            if action == 'import':
+            `object` when ``obj`` part was specified, `tuple` of objects when
+            multiple objects ``{A,B}`` were specified, otherwise `~types.ModuleType`.
+        """
+        if lazy:
+            return LazyObject(
+                self,
+                partial(self._load, modname, on_conflict, rename, cache, transaction),
+            )
+        return self._load(modname, on_conflict, rename, cache, transaction)
+
+    # internal helpers
+
+    def _default_modname(self) -> str:
+        return self.module
+
+    def _source(self) -> Tuple[Any, ...]:
+        return (ModuleLocation, self.module)
+
+    def _prepare(self, compile: bool = False) -> Optional['PreparedFile']:
+        if compile:
+            warm_bytecode(self.module)
+        return None
+
+    def _import(
+        self,
+        modname: str,
+        action: Literal['use', 'import'],
+        prepared: Optional['PreparedFile'],
+        timer: Optional[PhaseTimer] = None,
+    ) -> ModuleType:
+        if action == 'import':
+            try:
+                modobj = importlib.import_module(modname)
+            except ModuleNotFoundError as exc:
+                raise exc
+            except Exception as exc:
+                raise self._import_error(modname) from exc
+            if timer is not None:
+                timer.mark('exec')
+            origin = source_path(getattr(modobj, '__spec__', None))
+            if origin is not None and not hasattr(modobj, '__importloc_fingerprint__'):
                 try:
-                    modobj = importlib.import_module(modname)
-                except ModuleNotFoundError as exc:
-                    raise exc
-                except Exception as exc:
-                    raise self._import_error(modname) from exc
-            elif action == 'use':
-                modobj = sys.modules[modname]
-            else:
-                raise RuntimeError('unreachable')
-            # get object
-            if self.obj is None:
-                return modobj
-            else:
-                return getattr_nested(modobj, self.obj)
+                    st = os.stat(origin)
+                except OSError:
+                    pass
+                else:
+                    fingerprint = Fingerprint(st.st_mtime_ns, st.st_size)
+                    modobj.__importloc_fingerprint__ = fingerprint  # type: ignore[attr-defined]
+            return modobj
+        elif action == 'use':
+            return sys.modules[modname]
+        else:
+            raise RuntimeError('unreachable')
 
     def __repr__(self) -> str:
         cls = self.__class__.__name__
@@ -327,14 +768,38 @@ class PathLocation(Location):
     __init__(self, *, path: Union[~pathlib.Path, str], obj: Optional[str] = None) -> None
 
     Filesystem-based importable location, e.g. ``foo/bar.py:obj``
+
+    Besides Python source files, sourceless bytecode files ``*.pyc`` are supported.
     """
 
+    __slots__ = ('path',)
+
     path: Path
-    RX = re.compile(rf'^(?P<path>{_PYPATH})(?::(?P<obj>{_OBJ}))?$')
+    RX = re.compile(rf'^(?P<path>{_PYPATH})(?::(?P<obj>{_OBJS}))?$')
 
     # bypass Location.__new__
-    def __new__(cls, *args: Any, **kwargs: Any) -> 'PathLocation':
-        return object.__new__(cls)
+    def __new__(
+        cls,
+        spec: Union[str, Path, None] = None,
+        *,
+        path: Union[Path, str, None] = None,
+        obj: Optional[str] = None,
+    ) -> 'PathLocation':
+        if spec is None:
+            if path is None:
+                raise cls._arg_required_with_no_spec('path')
+            path = Path(path)
+            spec = str(path) if obj is None else f'{path}:{obj}'
+            return cls._create(spec, path, obj)
+        else:
+            if path is not None or obj is not None:
+                raise cls._args_denied_with_spec()
+            if isinstance(spec, Path):
+                return cls._create(str(spec), spec, None)
+            elif isinstance(spec, str):
+                return parse_location(spec, cls)  # type: ignore[return-value]
+            else:
+                raise TypeError(f'Unexpected spec type {type(spec)}')
 
     def __init__(
         self,
@@ -349,40 +814,39 @@ class PathLocation(Location):
             is passed, other arguments must be absent or `None`.
 
         :param path:
-            path to python source file to import from; required, if ``spec`` is
-            not passed.
+            path to python source or bytecode file to import from; required, if
+            ``spec`` is not passed.
 
         :param obj:
-            dot-separated object name to be imported; when missing, the whole file
-            will be imported as module
+            dot-separated object name to be imported, or comma-separated names in
+            curly braces, e.g. ``{A,B.C}``; when missing, the whole file will be
+            imported as module
 
         :raises ValueError:
             when passed incorrect arguments.
         :raises InvalidLocation:
             when location string format is incorrect.
         """
-        if spec is None:
-            if path is None:
-                raise self._arg_required_with_no_spec('path')
-            self.path = Path(path)
-            self.obj = obj
-            self.spec = str(path) if self.obj is None else f'{self.path}:{self.obj}'
-        else:
-            if path is not None or obj is not None:
-                raise self._args_denied_with_spec()
-            if isinstance(spec, Path):
-                self.spec = str(spec)
-                self.path = spec
-                self.obj = None
-            elif isinstance(spec, str):
-                match = self.match(spec)
-                if match is None:
-                    raise InvalidLocation(spec)
-                self.spec = spec
-                self.path = Path(match.group('path'))
-                self.obj = match.groupdict().get('obj', None)
-            else:
-                raise TypeError(f'Unexpected spec type {type(spec)}')
+        # immutable object is completely initialized in __new__
+
+    @classmethod
+    def _create(cls, spec: str, path: Path, obj: Optional[str]) -> Self:
+        self = object.__new__(cls)
+        object.__setattr__(self, 'spec', spec)
+        object.__setattr__(self, 'path', path)
+        self._set_obj(obj)
+        self._freeze()
+        return self
+
+    @classmethod
+    def _from_match(cls, spec: str, match: re.Match[str]) -> Self:
+        return cls._create(spec, Path(match.group('path')), match.group('obj'))
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.path, self.obj)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self._create, (self.spec, self.path, self.obj))
 
     @classmethod
     def match(cls, spec: str) -> Optional[re.Match[str]]:
@@ -400,6 +864,11 @@ class PathLocation(Location):
         modname: Union[str, Callable[[Self], str], None] = None,
         on_conflict: Union[ConflictResolution, str] = 'raise',
         rename: Optional[Callable[[str, Self], str]] = None,
+        *,
+        lazy: bool = False,
+        cache: bool = False,
+        transaction: bool = False,
+        prefer_bytecode: bool = False,
     ) -> Union[object, ModuleType]:
         """
         Import requested object or the whole module object from location.
@@ -413,7 +882,9 @@ class PathLocation(Location):
             name under which the module will be imported; if `str`,
             use ``modname`` itself; if `~typing.Callable`, use result of
             calling ``modname()`` with current `Location` object;
-            by default, use ``path`` stem from ``spec``.
+            by default, use ``path`` stem from ``spec``; for bytecode files, the
+            part of file name before the first dot, e.g. ``mod`` for
+            ``mod.cpython-312.pyc``.
 
         :param on_conflict:
             behaviour if ``modname`` is already present in `sys.modules`
@@ -424,8 +895,30 @@ class PathLocation(Location):
             ``on_conflict`` is ``rename``; first string argument is ``modname`` that
             leads to conflict, second argument is current `Location`.
 
+        :param lazy:
+            if `True`, return `~importloc.lazy.LazyObject` proxy immediately, and
+            defer loading until the proxy is used for the first time; all errors
+            are deferred too.
+
+        :param cache:
+            if `True`, cache returned object by ``(location, modname)``, and return
+            cached object on subsequent calls while the module remains in
+            `sys.modules` and is not reloaded or unloaded by `importloc`; requires
+            ``on_conflict='reuse'``, and ``modname`` to be `str` or `None`.
+
+        :param transaction:
+            if `True`, on import error also remove all modules imported in the
+            current thread while loading, e.g. dependencies and submodules imported
+            by the failed module, and restore replaced ones.
+
+        :param prefer_bytecode:
+            if `True` and ``path`` is a source file, load its ``__pycache__``
+            entry, if it exists, without checking it against the source file, the
+            same as unchecked hash-based ``.pyc`` (:pep:`552`); source file is not
+            accessed at all in this case. If there is no cache entry, load source.
+
         :raises TypeError | ValueError:
-            when passed arguments of wrong type.
+            when passed arguments of wrong type or incompatible arguments.
         :raises ModuleNameConflict:
             see `ConflictResolution` for details.
         :raises FileNotFoundError:
@@ -435,44 +928,100 @@ class PathLocation(Location):
         :raises ImportError:
             when module import fails.
         :raises AttributeError:
-            when ``obj`` name can't be found in imported module.
+            when ``obj`` name can't be found in imported module; if any of multiple
+            objects can't be found, newly imported module is rolled back.
 
         :return:
-            `object` when ``obj`` part was specified, otherwise `~types.ModuleType`.
-        """
-        modname, action = resolve_module_name(
-            default=self.path.stem,
-            override=modname,
-            on_conflict=on_conflict,
-            rename=rename,
-            loc=self,
+            `object` when ``obj`` part was specified, `tuple` of objects when
+            multiple objects ``{A,B}`` were specified, otherwise `~types.ModuleType`.
+        """
+        prepare = (
+            partial(self._prepare, prefer_bytecode=True) if prefer_bytecode else None
         )
-        # validate path
-        path = self.path.resolve()
-        if not path.exists():
-            raise FileNotFoundError(f'Path "{path}" does not exist.')
-        elif path.is_dir():
-            raise IsADirectoryError(f'Path "{path}" is a directory.')
-        # load
-        with atomic_import(modname):
-            # import module
-            if action == 'import':
-                spec = importlib.util.spec_from_file_location(modname, path)
-                if spec is None or spec.loader is None:
-                    raise self._import_error(modname)
-                try:
-                    modobj = load_from_spec(spec)
-                except Exception as exc:
-                    raise self._import_error(modname) from exc
-            elif action == 'use':
-                modobj = sys.modules[modname]
-            else:
-                raise RuntimeError('unreachable')
-            # get object
-            if self.obj is None:
-                return modobj
+        if lazy:
+            return LazyObject(
+                self,
+                partial(
+                    self._load,
+                    modname,
+                    on_conflict,
+                    rename,
+                    cache,
+                    transaction,
+                    prepare,
+                ),
+            )
+        return self._load(modname, on_conflict, rename, cache, transaction, prepare)
+
+    # internal helpers
+
+    def _default_modname(self) -> str:
+        if self.path.suffix == '.pyc':
+            # strip interpreter tag, e.g. mod.cpython-312.pyc
+            return self.path.name.partition('.')[0]
+        return self.path.stem
+
+    def _source(self) -> Tuple[Any, ...]:
+        return (PathLocation, os.path.abspath(self.path))
+
+    def _prepare(
+        self, compile: bool = False, prefer_bytecode: bool = False
+    ) -> 'PreparedFile':
+        if prefer_bytecode and self.path.suffix == '.py':
+            cached = cached_bytecode(os.path.abspath(self.path))
+            if cached is not None:
+                return PreparedFile(Path(cached[0]), None, cached[1])
+        # validate path with single stat, stat result is reused by the loader
+        path = resolve_path(self.path)
+        st = stat_file(path)
+        if not compile:
+            return PreparedFile(path, None, st)
+        # compile errors are reported by the loader when the module is executed
+        try:
+            loader = file_loader(self._default_modname(), str(path), st)
+            cache = get_code_cache()
+            if cache is None:
+                code = loader.get_code(loader.name)
             else:
-                return getattr_nested(modobj, self.obj)
+                code = cache.get_code(loader, str(path), stat=st)
+        except Exception:
+            code = None
+        return PreparedFile(path, code, st)
+
+    def _import(
+        self,
+        modname: str,
+        action: Literal['use', 'import'],
+        prepared: Optional['PreparedFile'],
+        timer: Optional[PhaseTimer] = None,
+    ) -> ModuleType:
+        if prepared is None:
+            prepared = self._prepare()
+        if action == 'import':
+            st = prepared.stat
+            if st is not None:
+                modobj = lookup_file(st)
+                if modobj is not None and modobj.__name__ != modname:
+                    # same file is already loaded under another name
+                    sys.modules[modname] = modobj
+                    return modobj
+            loader = file_loader(modname, str(prepared.path))
+            spec = importlib.util.spec_from_file_location(
+                modname, prepared.path, loader=loader
+            )
+            if spec is None:
+                raise self._import_error(modname)
+            try:
+                modobj = load_from_spec(spec, code=prepared.code, timer=timer, stat=st)
+            except Exception as exc:
+                raise self._import_error(modname) from exc
+            if st is not None:
+                register_file(st, modobj)
+            return modobj
+        elif action == 'use':
+            return sys.modules[modname]
+        else:
+            raise RuntimeError('unreachable')
 
     def __repr__(self) -> str:
         cls = self.__class__.__name__
@@ -482,6 +1031,264 @@ class PathLocation(Location):
             return '<{} {!r} obj={!r}>'.format(cls, str(self.path), self.obj)
 
 
+class ZipLocation(Location):
+    """
+    __init__(self, spec: str) -> None
+    __init__(self, *, archive: Union[~pathlib.Path, str], member: str, obj: Optional[str] = None) -> None
+
+    Zip archive member importable location, e.g. ``bundle.zip/pkg/mod.py:obj``
+
+    Modules are imported directly from the archive, without extracting. Each
+    archive is opened once, and its central directory is shared by all loads from
+    that archive until archive file is changed.
+
+    When archive is a directory, e.g. ``plugins.zip/a.py`` with ``plugins.zip``
+    directory, member is loaded as a plain file, like with `PathLocation`. This is
+    checked on each load, parsing does not depend on the file system.
+    """
+
+    __slots__ = ('archive', 'member')
+
+    archive: Path
+    member: str
+    RX = re.compile(
+        rf'^(?P<archive>{_ZIPPATH})/(?P<member>{_MEMBER})(?::(?P<obj>{_OBJS}))?$'
+    )
+
+    # bypass Location.__new__
+    def __new__(
+        cls,
+        spec: Optional[str] = None,
+        *,
+        archive: Union[Path, str, None] = None,
+        member: Optional[str] = None,
+        obj: Optional[str] = None,
+    ) -> 'ZipLocation':
+        if spec is None:
+            if archive is None:
+                raise cls._arg_required_with_no_spec('archive')
+            if member is None:
+                raise cls._arg_required_with_no_spec('member')
+            archive = Path(archive)
+            spec = f'{archive}/{member}' if obj is None else f'{archive}/{member}:{obj}'
+            return cls._create(spec, archive, member, obj)
+        else:
+            if archive is not None or member is not None or obj is not None:
+                raise cls._args_denied_with_spec()
+            return parse_location(spec, cls)  # type: ignore[return-value]
+
+    def __init__(
+        self,
+        spec: Optional[str] = None,
+        *,
+        archive: Union[Path, str, None] = None,
+        member: Optional[str] = None,
+        obj: Optional[str] = None,
+    ) -> None:
+        """
+        :param spec:
+            location specification string; if ``spec`` is passed, other arguments
+            must be absent or `None`.
+
+        :param archive:
+            path to zip archive; required, if ``spec`` is not passed.
+
+        :param member:
+            path to python source file inside the archive, relative to archive root
+            and separated with ``/``; required, if ``spec`` is not passed.
+
+        :param obj:
+            dot-separated object name to be imported, or comma-separated names in
+            curly braces, e.g. ``{A,B.C}``; when missing, the whole file will be
+            imported as module
+
+        :raises ValueError:
+            when passed incorrect arguments.
+        :raises InvalidLocation:
+            when location string format is incorrect.
+        """
+        # immutable object is completely initialized in __new__
+
+    @classmethod
+    def _create(cls, spec: str, archive: Path, member: str, obj: Optional[str]) -> Self:
+        self = object.__new__(cls)
+        object.__setattr__(self, 'spec', spec)
+        object.__setattr__(self, 'archive', archive)
+        object.__setattr__(self, 'member', member)
+        self._set_obj(obj)
+        self._freeze()
+        return self
+
+    @classmethod
+    def _from_match(cls, spec: str, match: re.Match[str]) -> Self:
+        return cls._create(
+            spec,
+            Path(match.group('archive')),
+            match.group('member'),
+            match.group('obj'),
+        )
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.archive, self.member, self.obj)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self._create, (self.spec, self.archive, self.member, self.obj))
+
+    @classmethod
+    def match(cls, spec: str) -> Optional[re.Match[str]]:
+        """
+        Match location specification string with corresponding regular expression.
+
+        :param spec:
+            location specification string.
+        """
+        return cls.RX.match(spec)
+
+    @override
+    def load(
+        self,
+        modname: Union[str, Callable[[Self], str], None] = None,
+        on_conflict: Union[ConflictResolution, str] = 'raise',
+        rename: Optional[Callable[[str, Self], str]] = None,
+        *,
+        lazy: bool = False,
+        cache: bool = False,
+        transaction: bool = False,
+    ) -> Union[object, ModuleType]:
+        """
+        Import requested object or the whole module object from zip archive member.
+
+        This operation is atomic:
+
+        * on import error, previous module with the same name is restored
+        * on import error, new partially initialized module is removed from `sys.modules`
+
+        Modules loaded from archives are never reloaded with
+        ``on_conflict='reload_if_changed'``.
+
+        :param modname:
+            name under which the module will be imported; if `str`,
+            use ``modname`` itself; if `~typing.Callable`, use result of
+            calling ``modname()`` with current `Location` object;
+            by default, use member file name without suffix.
+
+        :param on_conflict:
+            behaviour if ``modname`` is already present in `sys.modules`
+            (see `ConflictResolution` for details).
+
+        :param rename:
+            callable used to generate new module name on name conflict and if
+            ``on_conflict`` is ``rename``; first string argument is ``modname`` that
+            leads to conflict, second argument is current `Location`.
+
+        :param lazy:
+            see `Location.load`.
+
+        :param cache:
+            see `Location.load`.
+
+        :param transaction:
+            see `Location.load`.
+
+        :raises TypeError | ValueError:
+            when passed arguments of wrong type or incompatible arguments.
+        :raises ModuleNameConflict:
+            see `ConflictResolution` for details.
+        :raises FileNotFoundError:
+            when ``archive`` does not exist, or ``member`` is not found in archive.
+        :raises ImportError:
+            when module import fails.
+        :raises AttributeError:
+            when ``obj`` name can't be found in imported module; if any of multiple
+            objects can't be found, newly imported module is rolled back.
+
+        :return:
+            `object` when ``obj`` part was specified, `tuple` of objects when
+            multiple objects ``{A,B}`` were specified, otherwise `~types.ModuleType`.
+        """
+        if lazy:
+            return LazyObject(
+                self,
+                partial(self._load, modname, on_conflict, rename, cache, transaction),
+            )
+        return self._load(modname, on_conflict, rename, cache, transaction)
+
+    # internal helpers
+
+    def _default_modname(self) -> str:
+        return PurePosixPath(self.member).stem
+
+    def _source(self) -> Tuple[Any, ...]:
+        return (ZipLocation, os.path.abspath(self.archive), self.member)
+
+    def _directory_location(self) -> Optional[PathLocation]:
+        # directory with .zip suffix is checked at load time, not when parsing
+        if not os.path.isdir(self.archive):
+            return None
+        return PathLocation._create(self.spec, self.archive / self.member, self.obj)
+
+    def _prepare(self, compile: bool = False) -> 'PreparedFile':
+        loc = self._directory_location()
+        if loc is not None:
+            return loc._prepare(compile)
+        # validate archive and member
+        archive = resolve_path(self.archive)
+        zf, st = open_zip_archive(str(archive))
+        if self.member not in zf.NameToInfo:
+            raise FileNotFoundError(f'Member "{self.member}" not found in "{archive}".')
+        if not compile:
+            return PreparedFile(archive, None, st)
+        # compile errors are reported by the loader when the module is executed
+        try:
+            loader = ZipSourceLoader(self._default_modname(), str(archive), self.member)
+            cache = get_code_cache()
+            if cache is None:
+                code = loader.get_code(loader.name)
+            else:
+                code = cache.get_code(loader, loader.path, stat=st)
+        except Exception:
+            code = None
+        return PreparedFile(archive, code, st)
+
+    def _import(
+        self,
+        modname: str,
+        action: Literal['use', 'import'],
+        prepared: Optional['PreparedFile'],
+        timer: Optional[PhaseTimer] = None,
+    ) -> ModuleType:
+        loc = self._directory_location()
+        if loc is not None:
+            return loc._import(modname, action, prepared, timer)
+        if prepared is None:
+            prepared = self._prepare()
+        if action == 'import':
+            loader = ZipSourceLoader(modname, str(prepared.path), self.member)
+            spec = importlib.util.spec_from_file_location(
+                modname, loader.path, loader=loader
+            )
+            if spec is None:
+                raise self._import_error(modname)
+            try:
+                return load_from_spec(
+                    spec, code=prepared.code, timer=timer, stat=prepared.stat
+                )
+            except Exception as exc:
+                raise self._import_error(modname) from exc
+        elif action == 'use':
+            return sys.modules[modname]
+        else:
+            raise RuntimeError('unreachable')
+
+    def __repr__(self) -> str:
+        cls = self.__class__.__name__
+        spec = f'{self.archive}/{self.member}'
+        if self.obj is None:
+            return '<{} {!r}>'.format(cls, spec)
+        else:
+            return '<{} {!r} obj={!r}>'.format(cls, spec, self.obj)
+
+
 def unload(module: Union[str, ModuleType]) -> None:
     """
     Unload previously imported module. The module is not guaranteed to be garbage
@@ -505,6 +1312,67 @@ def unload(module: Union[str, ModuleType]) -> None:
     modobj = module if isinstance(module, ModuleType) else sys.modules[module]
     del sys.modules[modname]
     del modobj
+    _object_cache.invalidate(modname)
+
+
+def reload(module: Union[str, ModuleType], if_changed: bool = False) -> bool:
+    """
+    Reload previously imported module in place. Modules loaded from files with
+    `importloc` are re-executed from their original location, other modules are
+    passed to `importlib.reload`.
+
+    With ``if_changed=True``, module is re-executed only when its source file has
+    changed since the module was loaded or last reloaded: file ``mtime_ns`` and size
+    are compared first, and content hash is used when only modification time
+    differs and the hash was recorded. Fingerprint is recorded when module is
+    loaded with `importloc`, including modules imported by name; other modules
+    without recorded fingerprint are always reloaded, and modules without source
+    file are never reloaded.
+
+    Args:
+        module:
+            imported module name or module object to be reloaded.
+        if_changed:
+            skip reloading when source file was not changed.
+
+    Returns:
+        `True` if module was re-executed, otherwise `False`.
+
+    Raises:
+        KeyError: when there is no imported module with given name.
+        Exception: any exception raised by module code.
+
+    Example:
+        >>> reload('config', if_changed=True)
+        False
+    """
+    modobj = module if isinstance(module, ModuleType) else sys.modules[module]
+    spec = getattr(modobj, '__importloc_spec__', None)
+    origin = source_path(spec or modobj.__spec__)
+    fingerprint = None
+    if origin is not None:
+        st = os.stat(origin)
+        fingerprint = Fingerprint(st.st_mtime_ns, st.st_size)
+    if if_changed:
+        if origin is None or fingerprint is None:
+            return False
+        old = getattr(modobj, '__importloc_fingerprint__', None)
+        if old is not None and old[:2] == fingerprint[:2]:
+            return False
+        # stat differs, compare content hash lazily
+        fingerprint = fingerprint._replace(digest=file_digest(origin))
+        if old is not None and old.size == fingerprint.size:
+            if old.digest == fingerprint.digest:
+                modobj.__importloc_fingerprint__ = fingerprint  # type: ignore[attr-defined]
+                return False
+    _object_cache.invalidate(modobj)
+    if spec:
+        exec_from_spec(spec, modobj)
+    else:
+        importlib.reload(modobj)
+    if fingerprint is not None:
+        modobj.__importloc_fingerprint__ = fingerprint  # type: ignore[attr-defined]
+    return True
 
 
 # undocumented helpers
@@ -512,37 +1380,308 @@ def unload(module: Union[str, ModuleType]) -> None:
 
 L = TypeVar('L', bound=Location)
 
+#: Maximum number of cached location objects parsed from specification strings.
+PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_spec(
+    spec: str,
+    loctype: Union[type[ModuleLocation], type[PathLocation], type[ZipLocation], None],
+) -> Union[ModuleLocation, PathLocation, ZipLocation]:
+    if loctype is None:
+        loc = classify_spec(spec)
+        if loc is not None:
+            return loc
+        # ZipLocation specs match PathLocation too, so zip is tried first
+        loctypes: tuple[
+            Union[type[ModuleLocation], type[PathLocation], type[ZipLocation]], ...
+        ] = (ModuleLocation, ZipLocation, PathLocation)
+    else:
+        loctypes = (loctype,)
+    for lt in loctypes:
+        match = lt.match(spec)
+        if match:
+            return lt._from_match(spec, match)
+    raise InvalidLocation(spec)
+
+
+def classify_spec(spec: str) -> Union[ModuleLocation, PathLocation, None]:
+    # fast path for common specs, with result identical to regular expressions;
+    # None means that spec must be matched with regular expressions
+    if '\n' in spec or '{' in spec or '}' in spec or ',' in spec:
+        return None
+    head, sep, tail = spec.rpartition(':')
+    obj: Optional[str] = tail
+    if not sep:
+        head, obj = tail, None
+    elif ':' in head or not is_dotted_name(tail) or tail.endswith(('.py', '.pyc')):
+        # e.g. 'a/b.py:c.py' is PathLocation with path including colon
+        return None
+    if head.endswith(('.py', '.pyc')):
+        if '/' not in head or '.zip/' in head:
+            return None
+        return PathLocation._create(spec, Path(head), obj)
+    elif is_dotted_name(head):
+        return ModuleLocation._create(spec, head, obj)
+    return None
+
+
+def is_dotted_name(name: str) -> bool:
+    return '/' not in name and ':' not in name and '' not in name.split('.')
+
+
+def parse_location(
+    spec: str,
+    loctype: Union[type[ModuleLocation], type[PathLocation], type[ZipLocation], None],
+) -> Union[ModuleLocation, PathLocation, ZipLocation]:
+    if not _subscribers:
+        return parse_spec(spec, loctype)
+    timer = PhaseTimer()
+    loc = parse_spec(spec, loctype)
+    timer.mark('parse')
+    emit(LoadEvent(loc, None, timer.phases))
+    return loc
+
 
 @contextmanager
-def atomic_import(modname: str) -> Any:
+def atomic_import(modname: str, transaction: bool = False) -> Any:
     old = {m: sys.modules.get(m, None) for m in explode_module_name(modname)}
+    stack = (
+        transaction_stack() if transaction else getattr(_transactions, 'stack', None)
+    )
+    if transaction and stack is not None:
+        stack.append(old)
     try:
         yield
     except:
-        for name, value in old.items():
-            if value is not None:
-                sys.modules[name] = value
-            elif name in sys.modules:
-                del sys.modules[name]
+        if transaction and stack is not None:
+            old = stack.pop()
+        # roll back latest changes first
+        restore_modules(reversed(old.items()))
         raise
+    else:
+        if transaction and stack is not None:
+            old = stack.pop()
+        if stack:
+            # enclosing transaction will roll back these changes too
+            for name, value in old.items():
+                stack[-1].setdefault(name, value)
+
+
+def restore_modules(items: Iterable[Tuple[str, Optional[ModuleType]]]) -> None:
+    for name, value in items:
+        if value is not None:
+            sys.modules[name] = value
+        elif name in sys.modules:
+            del sys.modules[name]
 
 
-def load_from_spec(spec: ModuleSpec) -> ModuleType:
+class ImportTracker:
+    # meta path finder that never finds anything, but records modules imported by
+    # current thread while transaction is active; rollback cost is proportional
+    # to the number of imported modules, not to the size of sys.modules
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]] = None,
+        target: Optional[ModuleType] = None,
+    ) -> None:
+        stack = getattr(_transactions, 'stack', None)
+        if stack:
+            stack[-1].setdefault(fullname, sys.modules.get(fullname))
+
+
+_transactions = threading.local()
+_import_tracker = ImportTracker()
+_import_tracker_lock = threading.Lock()
+
+
+def transaction_stack() -> list[dict[str, Optional[ModuleType]]]:
+    stack: Optional[list[dict[str, Optional[ModuleType]]]]
+    stack = getattr(_transactions, 'stack', None)
+    if stack is None:
+        stack = _transactions.stack = []
+    # install tracker lazily, and again if removed from meta path by someone
+    if _import_tracker not in sys.meta_path:
+        with _import_tracker_lock:
+            if _import_tracker not in sys.meta_path:
+                sys.meta_path.insert(0, _import_tracker)
+    return stack
+
+
+class ZipSourceLoader(importlib.abc.SourceLoader):
+    # source loader for zip archive member; bytecode is not cached on disk
+
+    def __init__(self, name: str, archive: str, member: str) -> None:
+        self.name = name
+        self.archive = archive
+        self.member = member
+        self.path = f'{archive}/{member}'
+
+    def get_filename(self, fullname: str) -> str:
+        return self.path
+
+    def get_data(self, path: str) -> bytes:
+        if path != self.path:
+            raise OSError(f'Unexpected path {path}')
+        zf, _ = open_zip_archive(self.archive)
+        with _zip_archives_lock:
+            return zf.read(self.member)
+
+
+# opened archives with stat they were opened with, reopened when archive is changed
+_zip_archives: dict[str, Tuple[zipfile.ZipFile, os.stat_result]] = {}
+_zip_archives_lock = threading.Lock()
+
+
+def open_zip_archive(path: str) -> Tuple[zipfile.ZipFile, os.stat_result]:
+    st = stat_file(path)
+    with _zip_archives_lock:
+        entry = _zip_archives.get(path)
+        if entry is not None:
+            old = entry[1]
+            if (old.st_mtime_ns, old.st_size) == (st.st_mtime_ns, st.st_size):
+                return entry
+            entry[0].close()
+        entry = _zip_archives[path] = (zipfile.ZipFile(path), st)
+        return entry
+
+
+class PreparedFile(NamedTuple):
+    path: Path
+    code: Optional[CodeType]
+    # stat result of path, if known
+    stat: Optional[os.stat_result] = None
+
+
+def stat_file(path: Union[str, Path]) -> os.stat_result:
+    # single stat to validate that path exists and is not a directory
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError) as exc:
+        raise FileNotFoundError(f'Path "{path}" does not exist.') from exc
+    if stat.S_ISDIR(st.st_mode):
+        raise IsADirectoryError(f'Path "{path}" is a directory.')
+    return st
+
+
+def load_from_spec(
+    spec: ModuleSpec,
+    code: Optional[CodeType] = None,
+    timer: Optional[PhaseTimer] = None,
+    stat: Optional[os.stat_result] = None,
+) -> ModuleType:
+    # stat is result of os.stat for spec origin file or zip archive, if known
     modobj = importlib.util.module_from_spec(spec)
     modobj.__importloc_spec__ = spec  # type: ignore[attr-defined]
+    origin = source_path(spec)
+    if origin is not None:
+        st = os.stat(origin) if stat is None else stat
+        modobj.__importloc_fingerprint__ = Fingerprint(st.st_mtime_ns, st.st_size)  # type: ignore[attr-defined]
     sys.modules[spec.name] = modobj
     if spec.loader is None:
         raise ImportError(f'Loader not provided for module {spec.name}')
-    spec.loader.exec_module(modobj)
+    if timer is not None:
+        timer.mark('spec')
+    exec_from_spec(spec, modobj, code, stat)
+    if timer is not None:
+        timer.mark('exec')
     return modobj
 
 
-def reload(modobj: ModuleType) -> None:
-    spec = getattr(modobj, '__importloc_spec__', None)
-    if spec:
+def exec_from_spec(
+    spec: ModuleSpec,
+    modobj: ModuleType,
+    code: Optional[CodeType] = None,
+    stat: Optional[os.stat_result] = None,
+) -> None:
+    cache = get_code_cache()
+    if code is None and cache is not None and spec.origin:
+        if isinstance(spec.loader, (SourceFileLoader, SourcelessFileLoader)):
+            code = cache.get_code(spec.loader, spec.origin, stat=stat)
+        elif isinstance(spec.loader, ZipSourceLoader):
+            # member is keyed by archive stat, archive changes invalidate all members
+            if stat is None:
+                _, stat = open_zip_archive(spec.loader.archive)
+            code = cache.get_code(spec.loader, spec.loader.path, stat=stat)
+    if code is not None:
+        exec(code, modobj.__dict__)  # noqa: S102 # same as SourceFileLoader.exec_module
+    elif isinstance(spec.loader, StatSourceFileLoader):
+        # stat is used only once, reloads must check the file again
+        spec.loader.stat = stat
+        try:
+            spec.loader.exec_module(modobj)
+        finally:
+            spec.loader.stat = None
+    elif spec.loader is not None:
         spec.loader.exec_module(modobj)
     else:
-        importlib.reload(modobj)
+        raise ImportError(f'Loader not provided for module {spec.name}')
+
+
+class StatSourceFileLoader(SourceFileLoader):
+    # source loader that uses known stat result of the source file for bytecode
+    # cache validation, instead of calling os.stat again
+
+    stat: Optional[os.stat_result] = None
+
+    def path_stats(self, path: str) -> Mapping[str, Any]:
+        if self.stat is None or path != self.path:
+            return super().path_stats(path)
+        return {'mtime': self.stat.st_mtime, 'size': self.stat.st_size}
+
+
+def file_loader(
+    modname: str,
+    path: str,
+    stat: Optional[os.stat_result] = None,
+) -> Union[SourceFileLoader, SourcelessFileLoader]:
+    if path.endswith('.pyc'):
+        return SourcelessFileLoader(modname, path)
+    loader = StatSourceFileLoader(modname, path)
+    loader.stat = stat
+    return loader
+
+
+def cached_bytecode(path: str) -> Optional[Tuple[str, os.stat_result]]:
+    # existing __pycache__ entry for source file path
+    try:
+        pyc = importlib.util.cache_from_source(path)
+        st = os.stat(pyc)
+    except NotImplementedError:
+        return None  # bytecode caching is not supported by the interpreter
+    except OSError:
+        return None
+    return None if stat.S_ISDIR(st.st_mode) else (pyc, st)
+
+
+def warm_bytecode(modname: str, path: Optional[str] = None) -> None:
+    # find module without importing parent packages and compile it, writing
+    # bytecode cache if needed
+    try:
+        if path is not None:
+            loader = file_loader(modname, path)
+        else:
+            parent = modname.rpartition('.')[0]
+            if parent and parent not in sys.modules:
+                return
+            spec = importlib.util.find_spec(modname)
+            if spec is None or not isinstance(spec.loader, SourceFileLoader):
+                return
+            loader = spec.loader
+        loader.get_code(loader.name)
+    except Exception:  # noqa: S110 # errors are reported on import
+        pass
+
+
+def source_path(spec: Optional[ModuleSpec]) -> Optional[str]:
+    if spec is None or not spec.has_location or not spec.origin:
+        return None
+    if not isinstance(spec.loader, importlib.abc.FileLoader):
+        return None  # e.g. zip archive member
+    return spec.origin
 
 
 def explode_module_name(modname: str) -> Iterable[str]:
@@ -552,46 +1691,177 @@ def explode_module_name(modname: str) -> Iterable[str]:
         yield modname if end == -1 else modname[:end]
 
 
-def resolve_module_name(
+def get_module_name(
     default: str,
     override: Union[str, Callable[[L], str], None],
+    loc: L,
+) -> str:
+    if override is None:
+        return default
+    elif isinstance(override, str):
+        return override
+    elif callable(override):
+        return override(loc)
+    else:
+        raise ValueError(f'Unexpected modname override type {type(override)}')
+
+
+def resolve_conflict(
+    modname: str,
     on_conflict: Union[ConflictResolution, str],
     rename: Optional[Callable[[str, L], str]],
     loc: L,
-) -> Tuple[str, Literal['use', 'import']]:
+) -> Tuple[str, Literal['use', 'import'], bool]:
+    # returns module name, action, and whether existing module was re-executed
     # validate args
     on_conflict = ConflictResolution(on_conflict)
     if on_conflict == ConflictResolution.RENAME and not callable(rename):
         raise ValueError('rename must be callable')
 
-    # determine initial module name
-    if override is None:
-        modname = default
-    elif isinstance(override, str):
-        modname = override
-    elif callable(override):
-        modname = override(loc)
-    else:
-        raise ValueError(f'Unexpected modname override type {type(override)}')
-
     # module already imported?
     if modname not in sys.modules:
-        return modname, 'import'
+        return modname, 'import', False
 
     # resolve
     if on_conflict == ConflictResolution.REUSE:
-        return modname, 'use'
+        return modname, 'use', False
     elif on_conflict == ConflictResolution.RELOAD:
-        reload(sys.modules[modname])
-        return modname, 'use'
+        return modname, 'use', reload(sys.modules[modname])
+    elif on_conflict == ConflictResolution.RELOAD_IF_CHANGED:
+        return modname, 'use', reload(sys.modules[modname], if_changed=True)
     elif on_conflict == ConflictResolution.REPLACE:
-        return modname, 'import'
+        return modname, 'import', False
     elif on_conflict == ConflictResolution.RENAME:
         modname = rename(modname, loc)  # type: ignore # checked above
         if modname in sys.modules:
             raise ModuleNameConflict(modname)
-        return modname, 'import'
+        return modname, 'import', False
     elif on_conflict == ConflictResolution.RAISE:
         raise ModuleNameConflict(modname)
     else:
         raise RuntimeError('unreachable')
+
+
+# in-flight aload() calls, and preparations of module sources shared by them
+_inflight: dict[Tuple[Any, ...], 'asyncio.Task[object]'] = {}
+_inflight_prepare: dict[Tuple[Any, ...], 'asyncio.Future[Optional[PreparedFile]]'] = {}
+
+
+class ModuleLock:
+    # reentrant lock of module name with deadlock detection, similar to importlib
+    # module locks; lock can be acquired on behalf of another owner thread
+
+    def __init__(self, modname: str) -> None:
+        self.modname = modname
+        self.owner: Optional[int] = None
+        self.count = 0
+        self._cond = threading.Condition(threading.Lock())
+
+    def acquire(self, blocking: bool = True, owner: Optional[int] = None) -> bool:
+        if owner is None:
+            owner = threading.get_ident()
+        with self._cond:
+            if self.count and self.owner != owner:
+                if not blocking:
+                    return False
+                _blocking_on[owner] = self
+                try:
+                    while self.count:
+                        if self._has_deadlock(owner):
+                            raise ModuleLockDeadlock(self.modname)
+                        self._cond.wait()
+                finally:
+                    del _blocking_on[owner]
+            self.owner = owner
+            self.count += 1
+            return True
+
+    def release(self, owner: Optional[int] = None) -> None:
+        if owner is None:
+            owner = threading.get_ident()
+        with self._cond:
+            if not self.count or self.owner != owner:
+                raise RuntimeError('Cannot release un-acquired lock')
+            self.count -= 1
+            if not self.count:
+                self.owner = None
+                self._cond.notify()
+
+    def _has_deadlock(self, owner: int) -> bool:
+        # follow chain of lock owners waiting for other locks back to this owner
+        tid = self.owner
+        seen = set()
+        while tid is not None and tid not in seen:
+            if tid == owner:
+                return True
+            seen.add(tid)
+            lock = _blocking_on.get(tid)
+            tid = None if lock is None else lock.owner
+        return False
+
+    def __enter__(self) -> None:
+        self.acquire()
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+
+_module_locks: 'WeakValueDictionary[str, ModuleLock]' = WeakValueDictionary()
+_module_locks_guard = threading.Lock()
+# locks that threads are waiting for, used to detect deadlocks
+_blocking_on: dict[int, ModuleLock] = {}
+
+
+def get_module_lock(modname: str) -> ModuleLock:
+    # lock object lives while any thread holds or waits for it
+    with _module_locks_guard:
+        lock = _module_locks.get(modname)
+        if lock is None:
+            lock = _module_locks[modname] = ModuleLock(modname)
+        return lock
+
+
+@asynccontextmanager
+async def amodule_lock(modname: str) -> AsyncIterator[None]:
+    # same as module_lock, but locks are waited for in worker threads on behalf of
+    # event loop thread; all module name parts are locked, which is a superset of
+    # module_lock names, so that module_lock called from the event loop thread
+    # acquires all its locks reentrantly
+    owner = threading.get_ident()
+    acquired: list[ModuleLock] = []
+    try:
+        for name in explode_module_name(modname):
+            lock = get_module_lock(name)
+            if not lock.acquire(blocking=False, owner=owner):
+                await _aacquire(lock, owner)
+            acquired.append(lock)
+        yield
+    finally:
+        for lock in reversed(acquired):
+            lock.release(owner)
+
+
+async def _aacquire(lock: ModuleLock, owner: int) -> None:
+    task = asyncio.ensure_future(asyncio.to_thread(lock.acquire, True, owner))
+    try:
+        await asyncio.shield(task)
+    except asyncio.CancelledError:
+        # worker thread can't be interrupted, release the lock once acquired
+        def release(t: 'asyncio.Future[bool]') -> None:
+            if not t.cancelled() and t.exception() is None:
+                lock.release(owner)
+
+        task.add_done_callback(release)
+        raise
+
+
+@contextmanager
+def module_lock(modname: str) -> Iterator[None]:
+    # lock module name, and parent package names that are not imported yet, because
+    # they will be removed from sys.modules on rollback; locks are acquired in
+    # the same parent-to-child order by all threads
+    with ExitStack() as stack:
+        for name in explode_module_name(modname):
+            if name == modname or name not in sys.modules:
+                stack.enter_context(get_module_lock(name))
+        yield
@@ -0,0 +1,182 @@
+import json
+import os
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Any, Iterable, NamedTuple, Optional, Union
+
+from .cache import get_code_cache
+from .events import LoadEvent, subscribe, unsubscribe
+from .location import PathLocation, file_loader, source_path, warm_bytecode
+
+
+class ManifestEntry(NamedTuple):
+    """
+    Location loaded during previous run, recorded in `Manifest`.
+    """
+
+    #: Location specification string.
+    spec: str
+    #: Name under which the module was imported.
+    modname: str
+    #: Resolved module source file path, if any.
+    path: Optional[str]
+    #: Source file ``st_mtime_ns`` at the time of loading.
+    mtime_ns: Optional[int]
+    #: Source file size at the time of loading.
+    size: Optional[int]
+    #: Load duration in seconds.
+    duration: float
+
+
+class Manifest:
+    """
+    Warm-start manifest of locations loaded by the process, stored as JSON file.
+
+    On startup, create manifest and call `prefetch` to compile modules loaded
+    during previous run in background thread, while the main thread proceeds and
+    loads the same locations from warm caches: in-process code cache when it is
+    enabled with `~importloc.cache.enable_code_cache`, otherwise bytecode cache
+    files. Entries whose source files were changed or removed since they were
+    recorded are detected with single `os.stat` call and skipped.
+
+    While manifest is used as context manager, all successful loads are recorded,
+    and manifest file is saved on exit. Entries of previous run are discarded when
+    recording starts, so the saved manifest lists only locations loaded by the
+    current run.
+
+    Args:
+        path (``str`` | `~pathlib.Path`):
+            manifest file path; missing or unreadable file is treated as empty.
+
+    Example:
+        >>> enable_code_cache()
+        >>> manifest = Manifest('.importloc.json')
+        >>> manifest.prefetch()
+        >>> with manifest:
+        ...     app = Location('app/main.py:app').load()
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, 'os.PathLike[str]']) -> None:
+        self.path = Path(path)
+        #: Entries read from manifest file, replaced with recorded entries when
+        #: recording starts; in the order of first load.
+        self.entries: dict[tuple[str, str], ManifestEntry] = {}
+        self._lock = Lock()
+        try:
+            data = json.loads(self.path.read_text())
+            if isinstance(data, dict) and data.get('version') == self.VERSION:
+                for item in data['entries']:
+                    entry = ManifestEntry(**item)
+                    self.entries[entry.spec, entry.modname] = entry
+        except (OSError, ValueError, TypeError, KeyError):
+            self.entries.clear()
+
+    def prefetch(self, background: bool = True) -> Optional[Thread]:
+        """
+        Compile modules for valid manifest entries, in the order they were loaded.
+
+        Args:
+            background (``bool``):
+                if `True` (default), run in background daemon thread and return it.
+
+        Returns:
+            `~threading.Thread` | `None`: started thread if ``background`` is `True`.
+        """
+        entries = list(self.valid_entries())
+        if not background:
+            _prefetch(entries)
+            return None
+        thread = Thread(target=_prefetch, args=(entries,), daemon=True)
+        thread.start()
+        return thread
+
+    def valid_entries(self) -> Iterable[ManifestEntry]:
+        """
+        Get entries with source files that were not changed since recorded.
+        """
+        for entry in list(self.entries.values()):
+            if entry.path is None:
+                continue
+            try:
+                st = os.stat(entry.path)
+            except OSError:
+                continue
+            if (st.st_mtime_ns, st.st_size) == (entry.mtime_ns, entry.size):
+                yield entry
+
+    def record(self, event: LoadEvent) -> None:
+        """
+        Record successful load; called automatically while recording.
+        """
+        modobj = event.module
+        if modobj is None or event.modname is None:
+            return  # failed load or parse event
+        spec = getattr(modobj, '__importloc_spec__', None)
+        path = source_path(spec or getattr(modobj, '__spec__', None))
+        mtime_ns = size = None
+        fingerprint = getattr(modobj, '__importloc_fingerprint__', None)
+        if fingerprint is not None:
+            mtime_ns, size = fingerprint.mtime_ns, fingerprint.size
+        elif path is not None:
+            try:
+                st = os.stat(path)
+                mtime_ns, size = st.st_mtime_ns, st.st_size
+            except OSError:
+                path = None
+        entry = ManifestEntry(
+            event.location.spec, event.modname, path, mtime_ns, size, event.duration
+        )
+        with self._lock:
+            self.entries[entry.spec, entry.modname] = entry
+
+    def start(self) -> None:
+        """
+        Start recording loads, discarding entries of previous run.
+        """
+        with self._lock:
+            self.entries = {}
+        subscribe(self.record)
+
+    def stop(self) -> None:
+        """
+        Stop recording loads.
+        """
+        unsubscribe(self.record)
+
+    def save(self) -> None:
+        """
+        Write manifest file.
+        """
+        with self._lock:
+            items = [e._asdict() for e in self.entries.values()]
+        data: dict[str, Any] = {'version': self.VERSION, 'entries': items}
+        tmp = self.path.with_name(f'{self.path.name}.tmp')
+        tmp.write_text(json.dumps(data, indent=1))
+        os.replace(tmp, self.path)
+
+    def __enter__(self) -> 'Manifest':
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+        self.save()
+
+
+def _prefetch(entries: Iterable[ManifestEntry]) -> None:
+    cache = get_code_cache()
+    seen = set()
+    for entry in entries:
+        if entry.path is None or entry.path in seen:
+            continue
+        seen.add(entry.path)
+        if cache is not None and PathLocation.match(entry.spec):
+            loader = file_loader(entry.modname, entry.path)
+            try:
+                cache.get_code(loader, entry.path)
+            except Exception:  # noqa: S110 # errors are reported on load
+                pass
+        else:
+            warm_bytecode(entry.modname, entry.path)
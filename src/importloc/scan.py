@@ -0,0 +1,386 @@
+import ast
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+import importlib.util
+from importlib.machinery import FileFinder
+import os
+import pkgutil
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
+
+from .location import ConflictResolution, ModuleLocation, warm_bytecode
+from .util import OrderBy, T, get_instances, get_subclasses
+
+
+def walk_modules(
+    package: Union[ModuleLocation, str],
+    on_conflict: Union[ConflictResolution, str] = 'reuse',
+    onerror: Optional[Callable[[str, Exception], None]] = None,
+    workers: Optional[int] = None,
+) -> Iterator[ModuleType]:
+    """
+    Import package and all its subpackages and submodules recursively, and yield
+    them one by one in depth-first order, sorted by name within each package.
+
+    Each module is imported with `ModuleLocation.load()
+    <importloc.location.ModuleLocation.load>`, with the same conflict resolution
+    and atomicity rules. Next module is not imported until the previous one is
+    consumed, so the caller can stop early.
+
+    Args:
+        package (`ModuleLocation` | ``str``):
+            package location or name; if it is a plain module, only the module
+            itself is yielded.
+        on_conflict (`ConflictResolution` | ``str``):
+            behaviour if module is already present in `sys.modules`; defaults to
+            ``'reuse'``.
+        onerror (``Callable[[str, Exception], None]`` | ``None``):
+            if `None`, exceptions raised on submodule import are propagated;
+            otherwise, called with module name and exception, and walking continues.
+            Subpackages that fail to import are not walked.
+        workers (``int`` | ``None``):
+            if specified, submodules of each package are found and compiled
+            concurrently in a thread pool of this size, before they are imported
+            one by one on the calling thread.
+
+    Raises:
+        `Exception`: see `ModuleLocation.load()
+            <importloc.location.ModuleLocation.load>`.
+
+    Example:
+        >>> for mod in walk_modules('app.plugins', onerror=log_error):
+        ...     register(mod)
+    """
+    loc = package if isinstance(package, ModuleLocation) else ModuleLocation(package)
+    if loc.obj is not None:
+        raise ValueError('Package location must not have obj part')
+    root = cast(ModuleType, loc.load(on_conflict=on_conflict))
+    with ExitStack() as stack:
+        executor = None
+        if workers is not None:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+        yield root
+        yield from _walk_package(root, on_conflict, onerror, executor)
+
+
+def _walk_package(
+    package: ModuleType,
+    on_conflict: Union[ConflictResolution, str],
+    onerror: Optional[Callable[[str, Exception], None]],
+    executor: Optional[ThreadPoolExecutor],
+) -> Iterator[ModuleType]:
+    path = getattr(package, '__path__', None)
+    if path is None:
+        return
+    infos = sorted(
+        pkgutil.iter_modules(path, prefix=f'{package.__name__}.'),
+        key=lambda i: i.name,
+    )
+    prepared: dict[str, Future[None]] = {}
+    if executor is not None:
+        prepared = {i.name: executor.submit(warm_bytecode, i.name) for i in infos}
+    for info in infos:
+        if info.name in prepared:
+            prepared[info.name].result()
+        try:
+            modloc = ModuleLocation(module=info.name)
+            mod = cast(ModuleType, modloc.load(on_conflict=on_conflict))
+        except Exception as exc:
+            if onerror is None:
+                raise
+            onerror(info.name, exc)
+            continue
+        yield mod
+        if info.ispkg:
+            yield from _walk_package(mod, on_conflict, onerror, executor)
+
+
+def iter_subclasses(
+    package: Union[ModuleLocation, str],
+    cls: type[T],
+    order: Union[OrderBy, str, Callable[[T], Any]] = 'name',
+    on_conflict: Union[ConflictResolution, str] = 'reuse',
+    onerror: Optional[Callable[[str, Exception], None]] = None,
+    workers: Optional[int] = None,
+    static: bool = False,
+) -> Iterator[type[T]]:
+    """
+    Import package recursively with `walk_modules`, and yield subclasses of
+    specified class (excluding the class itself) defined in package modules.
+
+    Classes are yielded module by module, and are sorted within each module
+    according to ``order``. Classes re-exported by other modules are yielded once,
+    for the module where they are defined.
+
+    Args:
+        package (`ModuleLocation` | ``str``):
+            package location or name.
+        cls (`type`):
+            base class for returned subclasses.
+        order (`OrderBy` | ``str`` | ``Callable[[T], Any]``):
+            sorting method or sort key function within each module.
+        on_conflict, onerror, workers:
+            see `walk_modules`.
+        static (``bool``):
+            if `True`, parse package source files with `ast` first, without
+            executing them, and import only modules defining classes with bases
+            textually referencing ``cls`` or its candidate subclasses, see
+            `find_candidates`.
+
+    Example:
+        >>> for plugin in iter_subclasses('app.plugins', Plugin):
+        ...     if plugin.name == requested:
+        ...         break
+    """
+    if static:
+        modules = _load_candidates(
+            package, cls, 'subclasses', on_conflict, onerror, workers
+        )
+    else:
+        modules = walk_modules(package, on_conflict, onerror, workers)
+    for mod in modules:
+        for c in get_subclasses(mod, cls, order=order):
+            if c.__module__ == mod.__name__:
+                yield c
+
+
+def iter_instances(
+    package: Union[ModuleLocation, str],
+    cls: type[T],
+    order: Union[OrderBy, str, Callable[[T], Any]] = 'name',
+    on_conflict: Union[ConflictResolution, str] = 'reuse',
+    onerror: Optional[Callable[[str, Exception], None]] = None,
+    workers: Optional[int] = None,
+    static: bool = False,
+) -> Iterator[T]:
+    """
+    Import package recursively with `walk_modules`, and yield instances of
+    specified type found in package modules.
+
+    Objects are yielded module by module, and are sorted within each module
+    according to ``order``. Objects present in multiple modules are yielded once,
+    for the first module.
+
+    Args:
+        package (`ModuleLocation` | ``str``):
+            package location or name.
+        cls (`type`):
+            type of returned objects.
+        order (`OrderBy` | ``str`` | ``Callable[[T], Any]``):
+            sorting method or sort key function within each module.
+        on_conflict, onerror, workers:
+            see `walk_modules`.
+        static (``bool``):
+            if `True`, parse package source files with `ast` first, without
+            executing them, and import only modules with assignments calling
+            ``cls`` or its candidate subclasses, see `find_candidates`.
+
+    Example:
+        >>> handlers = dict((h.name, h) for h in iter_instances('app', Handler))
+    """
+    seen: set[int] = set()
+    if static:
+        modules = _load_candidates(
+            package, cls, 'instances', on_conflict, onerror, workers
+        )
+    else:
+        modules = walk_modules(package, on_conflict, onerror, workers)
+    for mod in modules:
+        for obj in get_instances(mod, cls, order=order):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                yield obj
+
+
+# static analysis
+
+
+def find_candidates(
+    package: Union[ModuleLocation, str],
+    cls: type,
+    kind: Literal['subclasses', 'instances'],
+) -> list[tuple[str, str]]:
+    """
+    Find package modules that may contain subclasses or instances of ``cls`` by
+    parsing their source files with `ast`, without executing them.
+
+    Candidate class names are ``cls.__name__`` and names of all classes in package
+    whose bases reference candidate class names, directly or through import aliases.
+    Module is a candidate for ``'subclasses'`` if it defines class with candidate
+    base; for ``'instances'``, if it has module level assignment with value calling
+    candidate class. Textual analysis can produce false positives, that should be
+    confirmed after import, and it misses objects created dynamically, e.g. by
+    factory functions.
+
+    Parsed source files are cached until modified.
+
+    Args:
+        package (`ModuleLocation` | ``str``):
+            package location or name; package itself is not imported, but its
+            parent packages are.
+        cls (`type`):
+            base class.
+        kind (``str``):
+            ``'subclasses'`` or ``'instances'``.
+
+    Returns:
+        ``list[tuple[str, str]]``: module names and source file paths, in the same
+        order as imported by `walk_modules`.
+    """
+    files = list(iter_module_files(package))
+    summaries = [summarize_source(path) for _, path in files]
+    # propagate candidate names through the class hierarchy defined in package
+    names = {cls.__name__}
+    changed = True
+    while changed:
+        changed = False
+        for summary in summaries:
+            for name, bases in summary.classes:
+                if name not in names and not bases.isdisjoint(names):
+                    names.add(name)
+                    changed = True
+    ret = []
+    for (modname, path), summary in zip(files, summaries):
+        if kind == 'subclasses':
+            found = any(not b.isdisjoint(names) for _, b in summary.classes)
+        elif kind == 'instances':
+            found = not summary.calls.isdisjoint(names)
+        else:
+            raise ValueError(f'Unexpected kind {kind!r}')
+        if found:
+            ret.append((modname, path))
+    return ret
+
+
+def iter_module_files(package: Union[ModuleLocation, str]) -> Iterator[tuple[str, str]]:
+    """
+    Iterate over names and source file paths of package and all its subpackages
+    and submodules, without importing them.
+    """
+    loc = package if isinstance(package, ModuleLocation) else ModuleLocation(package)
+    spec = importlib.util.find_spec(loc.module)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {loc.module!r}', name=loc.module)
+    if spec.origin and spec.origin.endswith('.py'):
+        yield loc.module, spec.origin
+    if spec.submodule_search_locations is not None:
+        yield from _iter_package_files(loc.module, spec.submodule_search_locations)
+
+
+def _iter_package_files(modname: str, path: Iterable[str]) -> Iterator[tuple[str, str]]:
+    infos = sorted(
+        pkgutil.iter_modules(path, prefix=f'{modname}.'), key=lambda i: i.name
+    )
+    for info in infos:
+        finder = info.module_finder
+        if not isinstance(finder, FileFinder):
+            continue
+        spec = finder.find_spec(info.name)
+        if spec is None:
+            continue
+        if spec.origin and spec.origin.endswith('.py'):
+            yield info.name, spec.origin
+        if info.ispkg and spec.submodule_search_locations:
+            yield from _iter_package_files(info.name, spec.submodule_search_locations)
+
+
+class SourceSummary(NamedTuple):
+    """
+    Names extracted from source file by `find_candidates`.
+    """
+
+    #: class names with sets of referenced base class names
+    classes: tuple[tuple[str, frozenset[str]], ...]
+    #: names of callables called in module level assignments
+    calls: frozenset[str]
+
+
+_summaries: dict[str, tuple[int, int, SourceSummary]] = {}
+
+
+def summarize_source(path: str) -> SourceSummary:
+    st = os.stat(path)
+    cached = _summaries.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+    aliases: dict[str, str] = {}
+    classes: list[tuple[str, list[str]]] = []
+    calls: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            for a in node.names:
+                if a.asname:
+                    aliases[a.asname] = a.name
+        elif isinstance(node, ast.ClassDef):
+            bases = [_ref_name(b) for b in node.bases]
+            classes.append((node.name, [b for b in bases if b]))
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Name):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    aliases[target.id] = node.value.id
+    for node in tree.body:
+        if not isinstance(node, (ast.Assign, ast.AnnAssign)):
+            continue
+        if isinstance(node.value, ast.Call):
+            name = _ref_name(node.value.func)
+            if name:
+                calls.add(aliases.get(name, name))
+    summary = SourceSummary(
+        classes=tuple(
+            (name, frozenset(aliases.get(b, b) for b in bases))
+            for name, bases in classes
+        ),
+        calls=frozenset(calls),
+    )
+    _summaries[path] = (st.st_mtime_ns, st.st_size, summary)
+    return summary
+
+
+def _ref_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        return node.attr
+    elif isinstance(node, ast.Subscript):
+        return _ref_name(node.value)
+    return None
+
+
+def _load_candidates(
+    package: Union[ModuleLocation, str],
+    cls: type,
+    kind: Literal['subclasses', 'instances'],
+    on_conflict: Union[ConflictResolution, str],
+    onerror: Optional[Callable[[str, Exception], None]],
+    workers: Optional[int],
+) -> Iterator[ModuleType]:
+    candidates = find_candidates(package, cls, kind)
+    with ExitStack() as stack:
+        prepared: dict[str, Future[None]] = {}
+        if workers is not None:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            prepared = {n: executor.submit(warm_bytecode, n, p) for n, p in candidates}
+        for modname, _ in candidates:
+            if modname in prepared:
+                prepared[modname].result()
+            try:
+                modloc = ModuleLocation(module=modname)
+                mod = cast(ModuleType, modloc.load(on_conflict=on_conflict))
+            except Exception as exc:
+                if onerror is None:
+                    raise
+                onerror(modname, exc)
+                continue
+            yield mod
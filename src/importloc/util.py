@@ -1,7 +1,13 @@
+import ast
 from base64 import b32encode
 from enum import Enum
+from functools import lru_cache
 import inspect
-from typing import Any, Callable, Optional, TypeVar, Union
+from operator import attrgetter
+import os
+import sys
+from types import ModuleType
+from typing import Any, Callable, Iterator, Literal, Optional, TypeVar, Union
 from uuid import uuid4
 
 
@@ -18,9 +24,9 @@ class OrderBy(str, Enum):
     NAME = 'name'
 
     #: Order by definition order in the source file, first by source filename path,
-    #: then by first line number. This sorting method uses `inspect.getsourcefile`
-    #: and `inspect.getsourcelines`, and inherits their requirements on objects
-    #: and exceptions raised.
+    #: then by line number. Classes and functions are located by their qualified
+    #: names, other objects by the name they are bound to by assignment. Source
+    #: files are parsed once with `ast` and cached until modified.
     SOURCE = 'source'
 
 
@@ -42,8 +48,9 @@ def get_instances(
             sorting method or sort key function; defaults to ``'name'``.
 
     Raises:
-        `TypeError`: or other `Exception` raised by `inspect.getfile` and
-            `inspect.getsourcelines` when sorting ``order='source'``.
+        `TypeError`: when sorting ``order='source'`` and object definition can't be
+            located in source file.
+        `OSError`: when sorting ``order='source'`` and source file can't be read.
 
     Returns:
         ``list[object]``:
@@ -52,17 +59,16 @@ def get_instances(
         >>> import app.plugins
         >>> plugins = get_instances(app.plugins, Plugin)
     """
-    ret = [mem for name, mem in inspect.getmembers(obj) if isinstance(mem, cls)]
-    order_key = get_sort_key_func(order)
-    if order_key:
-        ret.sort(key=order_key)
-    return ret
+    members = [(name, m) for name, m in inspect.getmembers(obj) if isinstance(m, cls)]
+    return sort_members(obj, members, order)
 
 
 def get_subclasses(
     obj: object,
     cls: type[T],
     order: Union[OrderBy, str, Callable[[T], Any]] = 'name',
+    *,
+    lookup: Literal['members', 'hierarchy'] = 'members',
 ) -> list[type[T]]:
     """
     Get object members that are subclasses of specified class (excluding the class
@@ -75,10 +81,17 @@ def get_subclasses(
             base class for returned subclasses.
         order (`OrderBy` | ``str`` | ``Callable[[T], Any]``):
             sorting method or sort key function; defaults to ``'name'``.
+        lookup (``str``):
+            if ``'members'`` (default), check all members of ``obj``; if
+            ``'hierarchy'``, traverse ``cls`` subclasses with `walk_subclasses`
+            and select those bound in ``obj`` under their own ``__name__``, which
+            is faster when ``obj`` has much more members than ``cls`` has
+            subclasses.
 
     Raises:
-        `TypeError`: or other `Exception` raised by `inspect.getfile` and
-            `inspect.getsourcelines` when sorting ``order='source'``.
+        `TypeError`: when sorting ``order='source'`` and object definition can't be
+            located in source file.
+        `OSError`: when sorting ``order='source'`` and source file can't be read.
 
     Returns:
         ``list[object]``:
@@ -88,15 +101,67 @@ def get_subclasses(
         >>> from tests import test_usage
         >>> cases = get_subclasses(test_usage, TestCase, order='source')
     """
-    ret = [
-        m
-        for name, m in inspect.getmembers(obj)
-        if isinstance(m, type) and issubclass(m, cls) and m is not cls
-    ]
-    order_key = get_sort_key_func(order)
-    if order_key:
-        ret.sort(key=order_key)
-    return ret
+    if lookup == 'members':
+        members = [
+            (name, m)
+            for name, m in inspect.getmembers(obj)
+            if isinstance(m, type) and issubclass(m, cls) and m is not cls
+        ]
+    elif lookup == 'hierarchy':
+        members = sorted(
+            (c.__name__, c)
+            for c in walk_subclasses(cls)
+            if getattr(obj, c.__name__, None) is c
+        )
+    else:
+        raise ValueError(f'Unexpected lookup value {lookup!r}')
+    return sort_members(obj, members, order)
+
+
+def walk_subclasses(
+    cls: type[T],
+    module: Union[str, ModuleType, None] = None,
+    package: Optional[str] = None,
+) -> Iterator[type[T]]:
+    """
+    Iterate over all direct and indirect subclasses of specified class (excluding the
+    class itself), in depth-first order, traversing ``__subclasses__()``. Each
+    subclass is returned once, even if reachable by multiple inheritance paths.
+
+    Args:
+        cls (`type`):
+            base class for returned subclasses.
+        module (``str`` | `~types.ModuleType` | ``None``):
+            if ``str``, return only subclasses with ``__module__`` equal to
+            ``module``; if module object, return only subclasses bound in ``module``
+            under their own ``__name__``, including re-exported ones.
+        package (``str`` | ``None``):
+            return only subclasses with ``__module__`` equal to ``package`` or
+            starting with ``package`` and dot.
+
+    Example:
+        >>> import app.plugins
+        >>> plugins = list(walk_subclasses(Plugin, module=app.plugins))
+        >>> all_plugins = list(walk_subclasses(Plugin, package='app'))
+    """
+    prefix = None if package is None else f'{package}.'
+    seen = {cls}
+    stack = list(reversed(type.__subclasses__(cls)))
+    while stack:
+        c = stack.pop()
+        if c in seen:
+            continue
+        seen.add(c)
+        stack.extend(reversed(type.__subclasses__(c)))
+        if isinstance(module, str) and c.__module__ != module:
+            continue
+        if isinstance(module, ModuleType) and vars(module).get(c.__name__) is not c:
+            continue
+        if prefix is not None and not (
+            c.__module__ == package or c.__module__.startswith(prefix)
+        ):
+            continue
+        yield c
 
 
 def getattr_nested(
@@ -134,16 +199,70 @@ def getattr_nested(
         >>> options = getattr_nested(config, f'{config.primary}.options')
         >>> missing = getattr_nested(config, 'does.not.exist', None)
     """
-    current = obj
-    for part in name.split('.'):
-        try:
-            current = getattr(current, part)
-        except AttributeError as exc:
-            if isinstance(default, type) and issubclass(default, Exception):
-                raise default(f'object has no attribute {name!r}') from exc
-            else:
+    return compile_getter(name, default)(obj)
+
+
+GETTER_CACHE_SIZE = 1024
+
+
+def compile_getter(
+    name: str,
+    default: Union[type[Exception], Any] = AttributeError,
+) -> Callable[[object], object]:
+    """
+    Compile nested attribute getter, equivalent to `getattr_nested` with the same
+    ``name`` and ``default``, but without parsing ``name`` on every call.
+
+    Getters are built with `operator.attrgetter`; getters for `None` and `Exception`
+    type ``default`` values are cached by ``(name, default)``.
+
+    Args:
+        name (`str`):
+            dot-separated nested attribute name.
+
+        default (`Exception` | `Any`):
+            see `getattr_nested`.
+
+    Returns:
+        callable taking single object argument and returning nested attribute
+        value or ``default`` value.
+
+    Example:
+        >>> get_options = compile_getter('primary.options')
+        >>> options = get_options(config)
+    """
+    if default is None or isinstance(default, type):
+        return _cached_getter(name, default)
+    return _make_getter(name, default)
+
+
+def _make_getter(
+    name: str,
+    default: Union[type[Exception], Any],
+) -> Callable[[object], object]:
+    get = attrgetter(name)
+    if isinstance(default, type) and issubclass(default, Exception):
+        exc_type = default
+        message = f'object has no attribute {name!r}'
+
+        def getter(obj: object) -> object:
+            try:
+                return get(obj)
+            except AttributeError as exc:
+                raise exc_type(message) from exc
+
+    else:
+
+        def getter(obj: object) -> object:
+            try:
+                return get(obj)
+            except AttributeError:
                 return default
-    return current
+
+    return getter
+
+
+_cached_getter = lru_cache(maxsize=GETTER_CACHE_SIZE)(_make_getter)
 
 
 def random_name(*args: Any, **kwargs: Any) -> str:
@@ -163,14 +282,108 @@ def random_name(*args: Any, **kwargs: Any) -> str:
 # undocumented helpers
 
 
-def get_sort_key_func(
-    order: Union[OrderBy, str, Callable[[T], Any]],
-) -> Optional[Callable[[Any], Any]]:
-    if order == 'name':
-        return None
-    elif order == 'source':
-        return lambda o: (inspect.getsourcefile(o), inspect.getsourcelines(o)[1])
+def sort_members(
+    obj: object,
+    members: list[tuple[str, Any]],
+    order: Union[OrderBy, str, Callable[[Any], Any]],
+) -> list[Any]:
+    # members are expected to be sorted by name, as returned by inspect.getmembers
+    if order == OrderBy.NAME:
+        return [m for _, m in members]
+    elif order == OrderBy.SOURCE:
+        key = SourcePositions(obj)
+        return [m for _, m in sorted(members, key=lambda nm: key(*nm))]
     elif callable(order):
-        return order
+        return sorted((m for _, m in members), key=order)
     else:
         raise TypeError('Unexpected order type {}'.format(type(order)))
+
+
+class SourcePositions:
+    """
+    Sort key function returning source file path and line number of member object
+    definition, for members of ``obj``.
+    """
+
+    def __init__(self, obj: object) -> None:
+        self.obj = obj
+        self.files: dict[str, Optional[str]] = {}
+
+    def __call__(self, name: str, member: object) -> tuple[str, int]:
+        # classes and functions are located by qualified name in their own module
+        modname = getattr(member, '__module__', None)
+        qualname = getattr(member, '__qualname__', None)
+        if isinstance(member, type) or inspect.isroutine(member):
+            if isinstance(modname, str) and isinstance(qualname, str):
+                pos = self.find(modname, qualname)
+                if pos is not None:
+                    return pos
+        # other objects are located by name they are bound to in container
+        if isinstance(self.obj, ModuleType):
+            pos = self.find(self.obj.__name__, name)
+        elif isinstance(self.obj, type):
+            pos = self.find(self.obj.__module__, f'{self.obj.__qualname__}.{name}')
+        else:
+            pos = None
+        if pos is None:
+            raise TypeError(f'Unable to locate source of {name!r}')
+        return pos
+
+    def find(self, modname: str, qualname: str) -> Optional[tuple[str, int]]:
+        if modname not in self.files:
+            module = sys.modules.get(modname)
+            path = getattr(module, '__file__', None)
+            self.files[modname] = path if path and path.endswith('.py') else None
+        path = self.files[modname]
+        if path is None:
+            return None
+        lineno = get_definition_index(path).get(qualname)
+        return None if lineno is None else (path, lineno)
+
+
+_definition_indexes: dict[str, tuple[int, int, dict[str, int]]] = {}
+
+
+def get_definition_index(path: str) -> dict[str, int]:
+    """
+    Get mapping of qualified names of classes, functions, and module or class level
+    assignment targets defined in source file to line numbers. Parsed index is
+    cached until file ``st_mtime_ns`` or ``st_size`` changes.
+    """
+    st = os.stat(path)
+    cached = _definition_indexes.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+    index: dict[str, int] = {}
+    build_definition_index(tree.body, '', index)
+    _definition_indexes[path] = (st.st_mtime_ns, st.st_size, index)
+    return index
+
+
+def build_definition_index(
+    body: list[ast.stmt],
+    prefix: str,
+    index: dict[str, int],
+) -> None:
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            index[f'{prefix}{node.name}'] = node.lineno
+            build_definition_index(node.body, f'{prefix}{node.name}.', index)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            index[f'{prefix}{node.name}'] = node.lineno
+            build_definition_index(node.body, f'{prefix}{node.name}.<locals>.', index)
+        elif prefix.endswith('<locals>.'):
+            continue  # local variables are not accessible
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for n in ast.walk(target):
+                    if isinstance(n, ast.Name):
+                        index[f'{prefix}{n.id}'] = node.lineno
+        elif isinstance(node, (ast.If, ast.Try, ast.With)):
+            for block in ('body', 'orelse', 'finalbody'):
+                build_definition_index(getattr(node, block, []), prefix, index)
+            for handler in getattr(node, 'handlers', []):
+                build_definition_index(handler.body, prefix, index)
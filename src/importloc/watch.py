@@ -0,0 +1,301 @@
+from dataclasses import dataclass
+import os
+import select
+import struct
+import sys
+from threading import Event, Thread
+import time
+from typing import Callable, Iterable, Literal, Optional, Union
+
+from .cache import file_digest
+from .location import ConflictResolution, PathLocation
+
+
+@dataclass
+class ReloadEvent:
+    """
+    Result of reloading changed location, passed to `Watcher` callback.
+    """
+
+    #: Location whose file was changed.
+    location: PathLocation
+    #: Object returned by `PathLocation.load() <importloc.location.PathLocation.load>`
+    #: or `None` on error.
+    result: object
+    #: Exception raised on reload, if any.
+    error: Optional[Exception] = None
+
+
+class Watcher:
+    """
+    Monitor files of `PathLocation` objects and reload them when file content
+    changes.
+
+    File changes are detected with inotify on Linux, if available, otherwise by
+    polling: files are grouped by directory, and each directory is scanned once per
+    poll with `os.scandir`. Bursts of changes are debounced, and location is
+    reloaded only when its file content hash differs from the one seen previously;
+    touching the file or rewriting the same content does not cause reload.
+
+    Reloads are performed and reported by `check`, either called directly or from
+    background thread started by `start` (the same thread executes module code).
+
+    Args:
+        locations (``Iterable[PathLocation]``):
+            locations to be monitored; relative paths are resolved immediately.
+        callback (``Callable[[ReloadEvent], None]``):
+            called after each reload attempt.
+        modname (``str`` | ``Callable`` | ``None``):
+            module name passed to `PathLocation.load()
+            <importloc.location.PathLocation.load>`.
+        on_conflict (`ConflictResolution` | ``str``):
+            conflict resolution passed to `PathLocation.load()
+            <importloc.location.PathLocation.load>`; defaults to ``'reload'``.
+        interval (``float``):
+            polling interval in seconds, also maximum delay of `stop` when running
+            in background thread.
+        debounce (``float``):
+            file is reloaded when it was not changed during this number of seconds.
+        backend (``str``):
+            ``'inotify'``, ``'poll'``, or ``'auto'`` (default) to use inotify when
+            available.
+
+    Example:
+        >>> locs = [Location(p) for p in glob('plugins/*.py')]
+        >>> with Watcher(locs, lambda e: print(e.location, e.error)):
+        ...     serve()
+    """
+
+    def __init__(
+        self,
+        locations: Iterable[PathLocation],
+        callback: Callable[[ReloadEvent], None],
+        *,
+        modname: Union[str, Callable[[PathLocation], str], None] = None,
+        on_conflict: Union[ConflictResolution, str] = 'reload',
+        interval: float = 1.0,
+        debounce: float = 0.1,
+        backend: Literal['auto', 'inotify', 'poll'] = 'auto',
+    ) -> None:
+        self.callback = callback
+        self.modname = modname
+        self.on_conflict = on_conflict
+        self.interval = interval
+        self.debounce = debounce
+        # watched files by directory and file name
+        self._files: dict[str, dict[str, list[PathLocation]]] = {}
+        for loc in locations:
+            resolved = loc.path.resolve()
+            names = self._files.setdefault(str(resolved.parent), {})
+            names.setdefault(resolved.name, []).append(loc)
+        # last observed stat and content hash of each file
+        self._stats: dict[str, tuple[int, int]] = {}
+        self._digests: dict[str, bytes] = {}
+        for path in self._iter_paths():
+            self._observe(path)
+        self._pending: dict[str, float] = {}
+        self._inotify: Optional[_Inotify] = None
+        if backend in ('auto', 'inotify'):
+            try:
+                self._inotify = _Inotify(self._files)
+            except OSError:
+                if backend == 'inotify':
+                    raise
+        elif backend != 'poll':
+            raise ValueError(f'Unexpected backend {backend!r}')
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def backend(self) -> Literal['inotify', 'poll']:
+        """
+        Actual backend used to detect file changes.
+        """
+        return 'poll' if self._inotify is None else 'inotify'
+
+    def check(self, timeout: float = 0) -> list[ReloadEvent]:
+        """
+        Wait for file changes up to ``timeout`` seconds, then reload changed
+        locations that are due after debouncing, and call ``callback`` for each.
+
+        Returns:
+            ``list[ReloadEvent]``: reload events, also passed to ``callback``.
+        """
+        now = time.monotonic()
+        if self._pending:
+            due = min(self._pending.values()) + self.debounce
+            timeout = max(0.0, min(timeout, due - now))
+        if self._inotify is not None:
+            for path in self._inotify.read(timeout):
+                self._pending[path] = time.monotonic()
+        else:
+            if timeout:
+                self._stop.wait(timeout)
+            for path in self._scan():
+                self._pending[path] = time.monotonic()
+        # reload due files
+        now = time.monotonic()
+        events = []
+        for path, changed in list(self._pending.items()):
+            if now - changed < self.debounce:
+                continue
+            del self._pending[path]
+            if not self._content_changed(path):
+                continue
+            dirname, name = os.path.split(path)
+            for loc in self._files[dirname][name]:
+                events.append(self._reload(loc))
+        return events
+
+    def start(self) -> None:
+        """
+        Start checking for changes in background daemon thread.
+        """
+        if self._thread is not None:
+            raise RuntimeError('Watcher is already started')
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name='importloc-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop background thread and wait until it exits.
+        """
+        if self._thread is None:
+            raise RuntimeError('Watcher is not started')
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def close(self) -> None:
+        """
+        Stop background thread, if started, and release resources.
+        """
+        if self._thread is not None:
+            self.stop()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self) -> 'Watcher':
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    # internal helpers
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.check(self.interval)
+
+    def _iter_paths(self) -> Iterable[str]:
+        for dirname, names in self._files.items():
+            for name in names:
+                yield os.path.join(dirname, name)
+
+    def _observe(self, path: str) -> None:
+        try:
+            st = os.stat(path)
+            self._stats[path] = (st.st_mtime_ns, st.st_size)
+            self._digests[path] = file_digest(path)
+        except OSError:
+            self._stats.pop(path, None)
+
+    def _scan(self) -> Iterable[str]:
+        for dirname, names in self._files.items():
+            try:
+                with os.scandir(dirname) as it:
+                    for entry in it:
+                        if entry.name not in names:
+                            continue
+                        st = entry.stat()
+                        path = entry.path
+                        if self._stats.get(path) != (st.st_mtime_ns, st.st_size):
+                            self._stats[path] = (st.st_mtime_ns, st.st_size)
+                            yield path
+            except OSError:
+                continue
+
+    def _content_changed(self, path: str) -> bool:
+        try:
+            digest = file_digest(path)
+            st = os.stat(path)
+        except OSError:
+            return False  # file removed, wait until it appears again
+        self._stats[path] = (st.st_mtime_ns, st.st_size)
+        if self._digests.get(path) == digest:
+            return False
+        self._digests[path] = digest
+        return True
+
+    def _reload(self, loc: PathLocation) -> ReloadEvent:
+        try:
+            result = loc.load(self.modname, on_conflict=self.on_conflict)
+        except Exception as exc:
+            event = ReloadEvent(loc, None, exc)
+        else:
+            event = ReloadEvent(loc, result)
+        self.callback(event)
+        return event
+
+
+# inotify
+
+
+class _Inotify:
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, files: dict[str, dict[str, list[PathLocation]]]) -> None:
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify is not supported on this platform')
+        import ctypes
+        import ctypes.util
+
+        libname = ctypes.util.find_library('c')
+        libc = ctypes.CDLL(libname, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.files = files
+        self.dirs: dict[int, str] = {}
+        for dirname in files:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(dirname), self.MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                os.close(self.fd)
+                raise OSError(errno, f'inotify_add_watch failed for {dirname}')
+            self.dirs[wd] = dirname
+
+    def read(self, timeout: float) -> set[str]:
+        changed: set[str] = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        while ready:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, _, _, size = self.EVENT.unpack_from(data, offset)
+                offset += self.EVENT.size
+                name = os.fsdecode(data[offset : offset + size].rstrip(b'\0'))
+                offset += size
+                dirname = self.dirs.get(wd)
+                if dirname is not None and name in self.files[dirname]:
+                    changed.add(os.path.join(dirname, name))
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
@@ -0,0 +1,123 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from importlib.machinery import SourceFileLoader
+import sys
+import threading
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from importloc import Location, ModuleNameConflict, PathLocation
+from importloc.dirlay import File
+from importloc.location import get_module_lock
+
+from .util import use_layout
+
+
+RECORD = """\
+import threading
+import shared
+shared.calls.append(threading.current_thread().name)
+x = len(shared.calls)
+"""
+
+
+class AsyncLoadTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self,
+            File('lib/shared.py', 'calls = []\n'),
+            File('app/record.py', RECORD),
+            File('app/broken.py', '1/0\n'),
+            File('app/models.py', 'class User: ...\nclass Group: ...\n'),
+            sys_path='lib',
+        )
+
+    async def test_aload(self) -> None:
+        x = await Location('app/record.py:x').aload()
+        self.assertEqual(1, x)
+        # module code is executed on the event loop thread
+        self.assertEqual([threading.current_thread().name], self.calls())
+        with self.assertRaises(ModuleNameConflict):
+            await Location('app/record.py').aload()
+
+    async def test_shared_load(self) -> None:
+        loc = Location('app/record.py:x')
+        results = await asyncio.gather(*(loc.aload() for _ in range(5)))
+        self.assertEqual([1] * 5, results)
+        self.assertEqual(1, len(self.calls()))
+
+    async def test_shared_prepare(self) -> None:
+        with patch.object(
+            PathLocation, '_prepare', autospec=True, side_effect=PathLocation._prepare
+        ) as prepare:
+            user, group = await asyncio.gather(
+                Location('app/models.py:User').aload(on_conflict='reuse'),
+                Location('app/models.py:Group').aload(on_conflict='reuse'),
+            )
+        self.assertEqual(1, prepare.call_count)
+        models = sys.modules['models']
+        self.assertEqual((models.User, models.Group), (user, group))
+
+    async def test_lock_does_not_block_loop(self) -> None:
+        lock = get_module_lock('record')
+        locked, release = threading.Event(), threading.Event()
+
+        def hold() -> None:
+            with lock:
+                locked.set()
+                release.wait(timeout=1)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        locked.wait()
+        task = asyncio.ensure_future(Location('app/record.py:x').aload())
+        try:
+            for _ in range(10):
+                await asyncio.sleep(0.01)  # loop keeps running
+            self.assertFalse(task.done())
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(1, await task)
+
+    async def test_exec_in_executor(self) -> None:
+        with ThreadPoolExecutor(1, thread_name_prefix='loader') as executor:
+            await Location('app/record.py').aload(
+                executor=executor, exec_in_executor=True
+            )
+        (thread,) = self.calls()
+        self.assertTrue(thread.startswith('loader'))
+
+    async def test_error(self) -> None:
+        loc = Location('app/broken.py')
+        for _ in range(2):
+            with self.assertRaises(ImportError):
+                await loc.aload()
+        self.assertNotIn('broken', sys.modules)
+        with self.assertRaises(FileNotFoundError):
+            await Location('app/missing.py').aload()
+
+    async def test_cache(self) -> None:
+        loc = Location('app/record.py:x')
+        x = await loc.aload(on_conflict='reuse', cache=True)
+        self.assertIs(x, await loc.aload(on_conflict='reuse', cache=True))
+        # same validation as load, even when the object is cached
+        with self.assertRaises(ValueError):
+            await loc.aload(cache=True)
+
+    async def test_reuse_not_compiled(self) -> None:
+        loc = Location('app/record.py:x')
+        with patch.object(
+            SourceFileLoader,
+            'get_code',
+            autospec=True,
+            side_effect=SourceFileLoader.get_code,
+        ) as get_code:
+            for _ in range(5):
+                self.assertEqual(1, await loc.aload(on_conflict='reuse'))
+        paths = [c.args[0].path for c in get_code.call_args_list]
+        self.assertEqual(1, sum(p.endswith('record.py') for p in paths))
+
+    def calls(self) -> list[str]:
+        calls: list[str] = sys.modules['shared'].calls
+        return calls
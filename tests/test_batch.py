@@ -0,0 +1,66 @@
+from importlib.machinery import SourceFileLoader
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+from importloc import Location, LoadManyError, load_many
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+class LoadManyTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self,
+            File('plugins/__init__.py', ''),
+            File('plugins/a.py', 'class A: ...\nclass B: ...\nCOUNT = [0]'),
+            File('plugins/b.py', 'from plugins.a import COUNT\nCOUNT[0] += 1'),
+            File('plugins/broken.py', 'raise RuntimeError("broken")'),
+            File('plugins/syntax.py', 'def'),
+            sys_path='.',
+        )
+
+    def test_results_order(self) -> None:
+        A, mod, B = load_many(['plugins/a.py:A', 'plugins.b', './plugins/a.py:B'])
+        self.assertEqual(('A', 'B'), (A.__name__, B.__name__))  # type: ignore[attr-defined]
+        self.assertIs(sys.modules['a'].A, A)
+        self.assertIs(sys.modules['plugins.b'], mod)
+
+    def test_module_loaded_once(self) -> None:
+        locs = ['plugins.a:COUNT', 'plugins.b', 'plugins.b', 'plugins.a:A']
+        count, *_ = load_many(locs, workers=2)
+        self.assertEqual([1], count)
+
+    def test_reuse_not_compiled(self) -> None:
+        a = Location('plugins/a.py').load()
+        get_code = SourceFileLoader.get_code
+        with patch.object(
+            SourceFileLoader, 'get_code', autospec=True, side_effect=get_code
+        ) as mock:
+            A, B = load_many(['plugins/a.py:A', 'plugins/a.py:B'], on_conflict='reuse')
+        self.assertEqual((a.A, a.B), (A, B))  # type: ignore[attr-defined]
+        self.assertEqual(0, mock.call_count)
+
+    def test_errors_aggregated(self) -> None:
+        with self.assertRaises(LoadManyError) as ctx:
+            load_many(
+                [
+                    'plugins/broken.py',
+                    'plugins/a.py:A',
+                    'plugins/syntax.py',
+                    'plugins/missing.py',
+                    'plugins.b:missing',
+                ]
+            )
+        errors = ctx.exception.errors
+        self.assertEqual(
+            [ImportError, ImportError, FileNotFoundError, AttributeError],
+            [type(e) for _, e in errors],
+        )
+        self.assertEqual(Location('plugins/broken.py'), errors[0][0])
+        self.assertEqual([Location('plugins/a.py:A')], list(ctx.exception.results))
+        # atomicity
+        self.assertNotIn('broken', sys.modules)
+        self.assertNotIn('plugins.b', sys.modules)
+        self.assertIn('a', sys.modules)
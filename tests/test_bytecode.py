@@ -0,0 +1,53 @@
+import importlib.util
+from importlib.machinery import SourcelessFileLoader
+import os
+import py_compile
+import sys
+from unittest import TestCase
+
+from importloc import Location, ModuleNameConflict, PathLocation
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+class BytecodeTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self, File('app/config.py', 'x = 1\n'), File('src/tool.py', 'x = 2\n')
+        )
+        # sourceless deployment: compiled files only
+        tag = sys.implementation.cache_tag
+        os.mkdir('build')
+        py_compile.compile('src/tool.py', cfile=f'build/tool.{tag}.pyc')
+        py_compile.compile('src/tool.py', cfile='build/legacy.pyc')
+        os.remove('src/tool.py')
+        self.pyc = f'build/tool.{tag}.pyc'
+
+    def test_sourceless(self) -> None:
+        loc = Location(f'{self.pyc}:x')
+        self.assertIsInstance(loc, PathLocation)
+        self.assertEqual(2, loc.load())
+        self.assertIsInstance(sys.modules['tool'].__loader__, SourcelessFileLoader)
+        with self.assertRaises(ModuleNameConflict):
+            loc.load()
+        self.assertEqual(2, loc.load(on_conflict='reuse'))
+        self.assertEqual(2, Location('build/legacy.pyc:x').load())
+        self.assertIn('legacy', sys.modules)
+
+    def test_prefer_bytecode(self) -> None:
+        py_compile.compile('app/config.py')
+        # source is changed, bytecode is used without checking
+        with open('app/config.py', 'w') as f:
+            f.write('x = 1000\n')
+        loc = PathLocation('app/config.py:x')
+        self.assertEqual(1, loc.load(prefer_bytecode=True))
+        self.assertTrue(str(sys.modules['config'].__file__).endswith('.pyc'))
+        self.assertEqual(1000, loc.load(on_conflict='replace'))
+
+    def test_prefer_bytecode_missing(self) -> None:
+        pyc = importlib.util.cache_from_source(os.path.abspath('app/config.py'))
+        self.assertFalse(os.path.exists(pyc))
+        loc = PathLocation('app/config.py:x')
+        self.assertEqual(1, loc.load(prefer_bytecode=True))
+        self.assertTrue(str(sys.modules['config'].__file__).endswith('.py'))
@@ -0,0 +1,222 @@
+from importlib.machinery import SourceFileLoader
+import os
+import sys
+from unittest import TestCase, mock
+
+from importloc import (
+    Location,
+    clear_object_cache,
+    clear_path_cache,
+    disable_code_cache,
+    disable_file_registry,
+    disable_path_cache,
+    enable_code_cache,
+    enable_file_registry,
+    enable_path_cache,
+    random_name,
+    reload,
+    unload,
+)
+from importloc.cache import MISSING, get_object_cache
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+class CodeCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(self, File('plugins/a.py', 'x = 1\n'))
+        self.cache = enable_code_cache(maxsize=2)
+
+    def tearDown(self) -> None:
+        disable_code_cache()
+
+    def test_repeated_load_hits(self) -> None:
+        for _ in range(3):
+            self.assertEqual(1, Location('plugins/a.py:x').load(random_name))
+        info = self.cache.cache_info()
+        self.assertEqual((2, 1, 2, 1), tuple(info))
+
+    def test_reload_hits(self) -> None:
+        mod = Location('plugins/a.py').load()
+        Location('plugins/a.py').load(on_conflict='reload')
+        self.assertIs(mod, sys.modules['a'])
+        self.assertEqual(1, self.cache.cache_info().hits)
+
+    def test_changed_file_misses(self) -> None:
+        Location('plugins/a.py').load()
+        path = self.layout.cwd / 'plugins/a.py'
+        path.write_text('x = 22\n')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        x = Location('plugins/a.py:x').load(on_conflict='replace')
+        self.assertEqual(22, x)
+        self.assertEqual((0, 2, 2, 1), tuple(self.cache.cache_info()))
+
+    def test_lru_eviction(self) -> None:
+        for name in ('b', 'c', 'd'):
+            (self.layout.cwd / f'plugins/{name}.py').write_text('')
+            Location(f'plugins/{name}.py').load()
+        self.assertEqual(2, self.cache.cache_info().currsize)
+        self.cache.cache_clear()
+        self.assertEqual((0, 0, 2, 0), tuple(self.cache.cache_info()))
+
+    def test_invalid_maxsize(self) -> None:
+        with self.assertRaises(ValueError):
+            enable_code_cache(maxsize=0)
+
+
+class ObjectCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(self, File('svc/handlers.py', 'class Handler: ...\n'))
+        self.loc = Location('svc/handlers.py:Handler')
+
+    def tearDown(self) -> None:
+        clear_object_cache()
+
+    def load(self) -> object:
+        return self.loc.load(on_conflict='reuse', cache=True)
+
+    def test_cached(self) -> None:
+        H = self.load()
+        self.assertIs(H, self.load())
+        self.assertIs(H, get_object_cache().get((self.loc, None)))
+
+    def test_invalidated_on_replace(self) -> None:
+        H = self.load()
+        self.loc.load(on_conflict='replace')
+        self.assertIsNot(H, self.load())
+        self.assertIs(sys.modules['handlers'].Handler, self.load())
+
+    def test_invalidated_on_reload(self) -> None:
+        H = self.load()
+        self.loc.load(on_conflict='reload')
+        self.assertIsNot(H, self.load())
+
+    def test_invalidated_on_unload(self) -> None:
+        H = self.load()
+        unload('handlers')
+        self.assertIs(MISSING, get_object_cache().get((self.loc, None)))
+        self.assertIsNot(H, self.load())
+
+    def test_incompatible_args(self) -> None:
+        with self.assertRaises(ValueError):
+            self.loc.load(cache=True)
+        with self.assertRaises(ValueError):
+            self.loc.load(random_name, on_conflict='reuse', cache=True)
+
+
+class PathCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self, File('v1/a.py', 'x = 1\n'), File('v2/a.py', 'x = 2\n')
+        )
+        os.symlink('v1', 'current')
+        enable_path_cache()
+
+    def tearDown(self) -> None:
+        disable_path_cache()
+
+    def load_x(self) -> object:
+        return Location('current/a.py:x').load(on_conflict='replace')
+
+    def test_cached_until_cleared(self) -> None:
+        self.assertEqual(1, self.load_x())
+        os.remove('current')
+        os.symlink('v2', 'current')
+        self.assertEqual(1, self.load_x())
+        clear_path_cache()
+        self.assertEqual(2, self.load_x())
+
+    def test_keyed_by_cwd(self) -> None:
+        self.assertEqual(1, self.load_x())
+        os.chdir('v2')
+        os.mkdir('current')
+        with open('current/a.py', 'w') as f:
+            f.write('x = 3\n')
+        self.assertEqual(3, self.load_x())
+
+
+class PathValidationTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self, File('app/a.py', 'x = 1\n'), File('app/dir.py/b.py', '')
+        )
+
+    def test_errors(self) -> None:
+        for spec, exc in (
+            ('app/missing.py', FileNotFoundError),
+            ('app/a.py/b.py', FileNotFoundError),
+            ('app/dir.py', IsADirectoryError),
+        ):
+            with self.subTest(spec=spec), self.assertRaises(exc):
+                Location(spec).load()
+
+    def test_source_stat_reused(self) -> None:
+        # loader does not stat the source file again after validation
+        with mock.patch.object(SourceFileLoader, 'path_stats') as path_stats:
+            self.assertEqual(1, Location('app/a.py:x').load())
+        path_stats.assert_not_called()
+        self.assertIsNone(getattr(sys.modules['a'].__loader__, 'stat'))  # noqa: B009
+
+
+class FileRegistryTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self,
+            File('plugins/a.py', 'import shared\nshared.calls += 1\nx = object()\n'),
+        )
+        os.symlink('plugins', 'link')
+        self.shared = type(sys)('shared')
+        self.shared.calls = 0  # type: ignore[attr-defined]
+        sys.modules['shared'] = self.shared
+        enable_file_registry()
+
+    def tearDown(self) -> None:
+        disable_file_registry()
+
+    def test_aliased(self) -> None:
+        mods = [
+            Location(spec).load(modname=random_name)
+            for spec in ('plugins/a.py', './plugins/a.py', 'link/../plugins/a.py')
+        ]
+        mods.append(
+            Location('link/a.py').load(on_conflict='rename', rename=random_name)
+        )
+        self.assertEqual(1, self.shared.calls)
+        self.assertTrue(all(m is mods[0] for m in mods))
+
+    def test_same_name_replaced(self) -> None:
+        Location('plugins/a.py').load()
+        Location('link/a.py').load(on_conflict='replace')
+        self.assertEqual(2, self.shared.calls)
+
+    def test_unloaded_not_reused(self) -> None:
+        Location('plugins/a.py').load()
+        unload('a')
+        Location('link/a.py').load(modname='b')
+        self.assertEqual(2, self.shared.calls)
+
+    def test_changed_not_reused(self) -> None:
+        Location('plugins/a.py').load()
+        st = os.stat('plugins/a.py')
+        os.utime('plugins/a.py', ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        Location('plugins/a.py').load(modname='b')
+        self.assertEqual(2, self.shared.calls)
+
+    def test_aliased_reload_invalidates_cache(self) -> None:
+        Location('plugins/a.py').load()
+        Location('plugins/../plugins/a.py').load(modname='b')
+        self.assertIs(sys.modules['a'], sys.modules['b'])
+        loc = Location('plugins/../plugins/a.py:x')
+        old = loc.load(modname='b', on_conflict='reuse', cache=True)
+        reload('a')
+        new = loc.load(modname='b', on_conflict='reuse', cache=True)
+        self.assertIsNot(old, new)
+        self.assertIs(sys.modules['b'].x, new)
+
+    def test_disabled(self) -> None:
+        disable_file_registry()
+        Location('plugins/a.py').load()
+        Location('plugins/a.py').load(modname='b')
+        self.assertEqual(2, self.shared.calls)
@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+from unittest import TestCase
+
+from importloc import Location, ModuleLockDeadlock
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+SHARED = """\
+import threading
+calls = []
+barrier = threading.Barrier(2, timeout=5)
+cycle = threading.Barrier(2, timeout=5)
+"""
+
+SLOW = """\
+import time
+import shared
+shared.calls.append(__name__)
+time.sleep(0.1)
+done = True
+"""
+
+WAITING = """\
+import shared
+shared.barrier.wait()
+"""
+
+
+CIRCULAR = """\
+import shared
+from importloc import Location
+if __name__ not in shared.calls:  # wait on the first run only
+    shared.calls.append(__name__)
+    shared.cycle.wait()
+Location('app/{other}.py').load(on_conflict='reuse')
+"""
+
+
+class ConcurrentLoadTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self,
+            File('lib/shared.py', SHARED),
+            File('app/slow.py', SLOW),
+            File('app/w1.py', WAITING),
+            File('app/w2.py', WAITING),
+            File('app/c1.py', CIRCULAR.format(other='c2')),
+            File('app/c2.py', CIRCULAR.format(other='c1')),
+            sys_path='lib',
+        )
+
+    def test_single_flight(self) -> None:
+        def load(_: int) -> tuple[object, bool]:
+            mod = Location('app/slow.py').load(on_conflict='reuse')
+            return mod, hasattr(mod, 'done')
+
+        with ThreadPoolExecutor(8) as executor:
+            mods, done = zip(*executor.map(load, range(8)))
+        # all callers wait for fully initialized module
+        self.assertTrue(all(done))
+        self.assertEqual(1, len({id(m) for m in mods}))
+        self.assertEqual(['slow'], sys.modules['shared'].calls)
+
+    def test_unrelated_not_serialized(self) -> None:
+        # both modules wait for each other, this deadlocks if loads are serialized
+        with ThreadPoolExecutor(2) as executor:
+            futures = [
+                executor.submit(Location(spec).load)
+                for spec in ('app/w1.py', 'app/w2.py')
+            ]
+            for f in futures:
+                f.result()
+        self.assertIn('w1', sys.modules)
+        self.assertIn('w2', sys.modules)
+
+    def test_circular_deadlock(self) -> None:
+        # each thread holds its module lock and waits for the other one
+        errors: list[ImportError] = []
+
+        def load(spec: str) -> None:
+            try:
+                Location(spec).load(on_conflict='reuse')
+            except ImportError as exc:
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(target=load, args=(spec,), daemon=True)
+            for spec in ('app/c1.py', 'app/c2.py')
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+        self.assertFalse(any(t.is_alive() for t in threads))
+        self.assertTrue(errors)
+        for exc in errors:
+            self.assertIsInstance(exc.__cause__, ModuleLockDeadlock)
@@ -0,0 +1,55 @@
+import os
+from pathlib import Path
+from unittest import TestCase
+
+from importloc.dirlay import DirectoryLayout, File
+
+
+FILES = (
+    File('pkg/__init__.py', ''),
+    File('pkg/sub/mod.py', 'x = 1\n'),
+    File('main.py', 'import pkg\n'),
+)
+
+
+class DirectoryLayoutTestCase(TestCase):
+    def test_modes(self) -> None:
+        for mode in ('write', 'copy', 'hardlink', 'clone'):
+            with self.subTest(mode=mode):
+                with DirectoryLayout(files=FILES, mode=mode) as layout:
+                    self.assertEqual(Path.cwd().resolve(), layout.cwd.resolve())
+                    self.assertEqual('x = 1\n', Path('pkg/sub/mod.py').read_text())
+                    self.assertEqual('', Path('pkg/__init__.py').read_text())
+
+    def test_isolated_copies(self) -> None:
+        with DirectoryLayout(files=FILES, mode='copy') as layout1:
+            (layout1.cwd / 'main.py').write_text('changed\n')
+            with DirectoryLayout(files=FILES, mode='copy') as layout2:
+                self.assertEqual('import pkg\n', (layout2.cwd / 'main.py').read_text())
+
+    def test_shared_template(self) -> None:
+        layout1 = DirectoryLayout(files=FILES, mode='hardlink')
+        layout2 = DirectoryLayout(files=FILES, mode='hardlink')
+        layout1.create()
+        layout2.create()
+        try:
+            st1 = os.stat(layout1.cwd / 'main.py')
+            st2 = os.stat(layout2.cwd / 'main.py')
+            self.assertEqual((st1.st_dev, st1.st_ino), (st2.st_dev, st2.st_ino))
+        finally:
+            layout1.destroy()
+            layout2.destroy()
+
+    def test_cleanup_on_error(self) -> None:
+        cwd = os.getcwd()
+        with self.assertRaises(ZeroDivisionError):
+            with DirectoryLayout(files=FILES) as layout:
+                root = layout.cwd
+                1 / 0  # noqa: B018
+        self.assertEqual(cwd, os.getcwd())
+        self.assertFalse(root.exists())
+
+    def test_write_files(self) -> None:
+        with DirectoryLayout(files=FILES) as layout:
+            layout.write_files(File(f'extra/m{i}.py', '') for i in range(10))
+            self.assertEqual(10, len(list((layout.cwd / 'extra').iterdir())))
@@ -0,0 +1,87 @@
+import sys
+from unittest import TestCase
+
+from importloc import (
+    LoadEvent,
+    LoadStats,
+    Location,
+    subscribe,
+    unsubscribe,
+)
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+class EventsTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self, File('app/a.py', 'x = 1\n'), File('app/broken.py', '1/0\n')
+        )
+        self.events: list[LoadEvent] = []
+        subscribe(self.events.append)
+
+    def tearDown(self) -> None:
+        unsubscribe(self.events.append)
+
+    def test_path_location(self) -> None:
+        Location.parse_cache_clear()
+        loc = Location('app/a.py:x')
+        loc.load()
+        parse, load = self.events
+        self.assertEqual((loc, None, ['parse']), (*parse[:2], list(parse.phases)))
+        self.assertEqual(
+            ['resolve', 'validate', 'spec', 'exec', 'getattr'], list(load.phases)
+        )
+        self.assertEqual('a', load.modname)
+        self.assertIs(sys.modules['a'], load.module)
+        self.assertIsNone(load.error)
+        self.assertAlmostEqual(sum(load.phases.values()), load.duration)
+
+    def test_module_location(self) -> None:
+        sys.path.insert(0, str(self.layout.cwd / 'app'))
+        try:
+            Location('a').load()
+        finally:
+            del sys.path[0]
+        load = self.events[-1]
+        self.assertEqual(['resolve', 'validate', 'exec', 'getattr'], list(load.phases))
+
+    def test_reuse(self) -> None:
+        Location('importloc').load(on_conflict='reuse')
+        load = self.events[-1]
+        self.assertEqual(['resolve', 'validate', 'getattr'], list(load.phases))
+
+    def test_error(self) -> None:
+        with self.assertRaises(ImportError):
+            Location('app/broken.py').load()
+        load = self.events[-1]
+        self.assertIsInstance(load.error, ImportError)
+        self.assertIsNone(load.module)
+        self.assertEqual(['resolve', 'validate', 'spec'], list(load.phases))
+
+    def test_unsubscribed(self) -> None:
+        unsubscribe(self.events.append)
+        Location('app/a.py').load()
+        self.assertEqual([], self.events)
+        subscribe(self.events.append)
+
+
+class LoadStatsTestCase(TestCase):
+    def test_stats(self) -> None:
+        loc = Location('importloc:Location')
+        with LoadStats() as stats:
+            for _ in range(10):
+                loc.load(on_conflict='reuse')
+        loc.load(on_conflict='reuse')
+        by_phase = {s.phase: s for s in stats.by_phase()}
+        self.assertEqual({'resolve', 'validate', 'getattr', 'total'}, set(by_phase))
+        total = by_phase['total']
+        self.assertEqual((None, 10), (total.location, total.calls))
+        self.assertLessEqual(total.p50, total.p99)
+        by_location = stats.by_location()
+        self.assertEqual({'importloc:Location'}, {s.location for s in by_location})
+        self.assertEqual('total', by_location[0].phase)
+        self.assertEqual(1 + 2 * 4, len(stats.report().splitlines()))
+        stats.clear()
+        self.assertEqual([], stats.by_phase())
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+from unittest import TestCase
+
+from importloc import compile_getter, getattr_nested
+
+
+class CustomError(Exception):
+    pass
+
+
+class CompileGetterTestCase(TestCase):
+    def setUp(self) -> None:
+        self.obj = SimpleNamespace(a=SimpleNamespace(b=SimpleNamespace(c=1)))
+
+    def test_get(self) -> None:
+        get = compile_getter('a.b.c')
+        self.assertEqual(1, get(self.obj))
+        self.assertIs(get, compile_getter('a.b.c'))
+        self.assertEqual(1, getattr_nested(self.obj, 'a.b.c'))
+
+    def test_error(self) -> None:
+        for default in (AttributeError, CustomError):
+            with self.subTest(default=default):
+                with self.assertRaises(default) as ctx:
+                    compile_getter('a.x.c', default)(self.obj)
+                self.assertEqual("object has no attribute 'a.x.c'", str(ctx.exception))
+                self.assertIsInstance(ctx.exception.__cause__, AttributeError)
+
+    def test_default(self) -> None:
+        self.assertIsNone(compile_getter('a.x', None)(self.obj))
+        self.assertEqual([], compile_getter('a.x', [])(self.obj))
+        self.assertIs(int, compile_getter('a.x', int)(self.obj))
+        # equal but not identical defaults are not mixed up
+        self.assertIs(True, compile_getter('a.x', True)(self.obj))
+        self.assertEqual(1, compile_getter('a.x', 1)(self.obj))
+        self.assertIsNot(True, compile_getter('a.x', 1)(self.obj))
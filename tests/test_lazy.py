@@ -0,0 +1,43 @@
+import sys
+from unittest import TestCase
+
+from importloc import LazyObject, Location
+from importloc.dirlay import File
+from importloc.lazy import unwrap
+
+from .util import use_layout
+
+
+class LazyLoadTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self,
+            File('app/__init__.py', ''),
+            File('app/cli.py', 'class Group:\n  name = "db"\ndef cli(): return 42'),
+            sys_path='.',
+        )
+
+    def test_deferred_call(self) -> None:
+        cli = Location('app.cli:cli').load(lazy=True)
+        self.assertIsInstance(cli, LazyObject)
+        self.assertEqual("<LazyObject <ModuleLocation 'app.cli' obj='cli'>>", repr(cli))
+        self.assertNotIn('app.cli', sys.modules)
+        self.assertEqual(42, cli())  # type: ignore[operator]
+        self.assertIs(sys.modules['app.cli'].cli, unwrap(cli))
+        self.assertTrue(repr(cli).startswith('<function cli'))
+
+    def test_deferred_attribute(self) -> None:
+        group = Location('app/cli.py:Group').load(lazy=True)
+        self.assertNotIn('cli', sys.modules)
+        self.assertEqual('db', group.name)  # type: ignore[attr-defined]
+        self.assertIn('cli', sys.modules)
+
+    def test_deferred_errors(self) -> None:
+        missing = Location('app/cli.py:missing').load(lazy=True)
+        with self.assertRaises(AttributeError):
+            missing()  # type: ignore[operator]
+        self.assertNotIn('cli', sys.modules)
+        Location('app/cli.py').load()
+        conflict = Location('app/cli.py').load(lazy=True)
+        with self.assertRaises(ImportError):
+            unwrap(conflict)
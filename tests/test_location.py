@@ -0,0 +1,161 @@
+from pathlib import Path
+import pickle
+import sys
+from unittest import TestCase
+
+from importloc import (
+    InvalidLocation,
+    Location,
+    ModuleLocation,
+    PathLocation,
+    ZipLocation,
+)
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+class ValueSemantics(TestCase):
+    def test_equal_and_hashable(self) -> None:
+        locs = {
+            Location('app.config:conf'),
+            ModuleLocation(module='app.config', obj='conf'),
+            Location('app/config.py:conf'),
+            PathLocation(path='app/config.py', obj='conf'),
+            Location(Path('app/config.py')),
+        }
+        self.assertEqual(3, len(locs))
+
+    def test_different_types_not_equal(self) -> None:
+        self.assertNotEqual(Location('a'), Location('./a.py'))
+        self.assertNotEqual(Location('a:b'), Location('a:c'))
+
+    def test_immutable(self) -> None:
+        loc = Location('app.config:conf')
+        with self.assertRaises(AttributeError):
+            loc.obj = 'other'
+        with self.assertRaises(AttributeError):
+            del loc.obj
+        with self.assertRaises(AttributeError):
+            loc.__dict__  # noqa: B018
+
+    def test_pickle(self) -> None:
+        for loc in (
+            Location('app.config:conf'),
+            PathLocation(path='config.py', obj='conf'),
+            PathLocation(Path('config.py')),
+        ):
+            copy = pickle.loads(pickle.dumps(loc))  # noqa: S301
+            self.assertEqual(loc, copy)
+            self.assertEqual(loc.spec, copy.spec)
+
+
+class ParseCache(TestCase):
+    def setUp(self) -> None:
+        Location.parse_cache_clear()
+
+    def test_shared_instance(self) -> None:
+        self.assertIs(Location('app.config:conf'), Location('app.config:conf'))
+        self.assertIs(PathLocation('app/a.py'), PathLocation('app/a.py'))
+        info = Location.parse_cache_info()
+        self.assertEqual((2, 2, 2), (info.hits, info.misses, info.currsize))
+
+    def test_specific_type_enforced(self) -> None:
+        Location('app.config')
+        with self.assertRaises(InvalidLocation):
+            PathLocation('app.config')
+
+    def test_invalid_not_cached(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(InvalidLocation):
+                Location('app/config.txt')
+        self.assertEqual(0, Location.parse_cache_info().currsize)
+
+
+class ParseMany(TestCase):
+    SPECS = (
+        'app.config:conf',
+        'app',
+        'app/config.py:Conf.nested',
+        '../config.py',
+        'build/main.cpython-312.pyc:app',
+        'bundle.zip/pkg/mod.py:obj',
+        'C:/app/config.py:conf',
+        'config.py',
+        'app/config.txt',
+        'app..config',
+        'app.config:',
+        ':conf',
+        'app/config.py:a/b',
+        'a:b:c',
+        'app/config.py\n',
+        '',
+        'app.models:{User,Role.Meta}',
+        'app/models.py:{ User , Group }',
+        'app:{A}',
+        'app:A}',
+        'app:{A,,B}',
+        'app:{}',
+        'app:A,B',
+        'a/b.py:c.py',
+        'a/b.py:c.pyc',
+    )
+
+    def test_same_as_regex(self) -> None:
+        for spec in self.SPECS:
+            with self.subTest(spec=spec):
+                expected = None
+                for lt in (ModuleLocation, ZipLocation, PathLocation):
+                    match = lt.match(spec)
+                    if match:
+                        expected = lt._from_match(spec, match)
+                        break
+                Location.parse_cache_clear()
+                try:
+                    loc = Location(spec)
+                except InvalidLocation:
+                    self.assertIsNone(expected)
+                else:
+                    self.assertIs(expected.__class__, loc.__class__)
+                    self.assertEqual(expected, loc)
+                    if isinstance(loc, PathLocation):
+                        self.assertEqual(loc, PathLocation(spec))
+
+    def test_errors(self) -> None:
+        lines = ['app.config:conf\n', '\n', 'app/config.txt\n', '  app/a.py  \n']
+        result = list(Location.parse_many(lines))
+        self.assertEqual(3, len(result))
+        self.assertEqual(Location('app.config:conf'), result[0])
+        self.assertEqual(Location('app/a.py'), result[2])
+        error = result[1]
+        assert isinstance(error, InvalidLocation)
+        self.assertEqual(('app/config.txt', 3), (error.spec, error.lineno))
+
+    def test_shared_instance(self) -> None:
+        (loc,) = Location.parse_many(['app/b.py:x'])
+        self.assertIs(Location('app/b.py:x'), loc)
+
+
+class MultiObject(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self, File('app/models.py', 'class User: ...\nclass Role:\n    Meta = 1\n')
+        )
+
+    def test_parse(self) -> None:
+        loc = Location('app/models.py:{ User , Role.Meta }')
+        self.assertEqual('{User,Role.Meta}', loc.obj)
+        self.assertEqual(('User', 'Role.Meta'), loc.objs)
+        self.assertEqual(Location('app/models.py:{User,Role.Meta}'), loc)
+        self.assertEqual(loc, pickle.loads(pickle.dumps(loc)))  # noqa: S301
+        self.assertIsNone(Location('app/models.py:User').objs)
+
+    def test_load(self) -> None:
+        objs = Location('app/models.py:{User,Role.Meta}').load()
+        mod = sys.modules['models']
+        self.assertEqual((mod.User, 1), objs)
+
+    def test_rollback(self) -> None:
+        with self.assertRaises(AttributeError):
+            Location('app/models.py:{User,Group}').load()
+        self.assertNotIn('models', sys.modules)
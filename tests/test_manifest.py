@@ -0,0 +1,101 @@
+import json
+import os
+import sys
+from unittest import TestCase
+
+from importloc import (
+    Location,
+    Manifest,
+    disable_code_cache,
+    enable_code_cache,
+    random_name,
+)
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+class ManifestTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self, File('app/a.py', 'x = 1\n'), File('app/b.py', 'x = 2\n')
+        )
+        self.path = self.layout.cwd / 'manifest.json'
+
+    def tearDown(self) -> None:
+        disable_code_cache()
+
+    def record(self) -> None:
+        with Manifest(self.path):
+            Location('app/a.py:x').load()
+            Location('app/b.py').load()
+            Location('app/a.py:x').load(on_conflict='reuse')
+        Location('app/a.py').load(on_conflict='replace')  # not recorded
+        for m in ('a', 'b'):
+            del sys.modules[m]
+
+    def test_record(self) -> None:
+        self.record()
+        data = json.loads(self.path.read_text())
+        entries = [(e['spec'], e['modname']) for e in data['entries']]
+        self.assertEqual([('app/a.py:x', 'a'), ('app/b.py', 'b')], entries)
+        manifest = Manifest(self.path)
+        self.assertEqual(2, len(list(manifest.valid_entries())))
+        self.assertEqual(
+            str((self.layout.cwd / 'app/a.py').resolve()),
+            data['entries'][0]['path'],
+        )
+
+    def test_prefetch(self) -> None:
+        self.record()
+        cache = enable_code_cache()
+        thread = Manifest(self.path).prefetch()
+        assert thread is not None
+        thread.join()
+        self.assertEqual((0, 2, 256, 2), tuple(cache.cache_info()))
+        self.assertEqual(1, Location('app/a.py:x').load())
+        self.assertEqual(1, cache.cache_info().hits)
+
+    def test_previous_run_discarded(self) -> None:
+        for _ in range(3):
+            with Manifest(self.path):
+                Location('app/a.py:x').load(modname=random_name)
+        manifest = Manifest(self.path)
+        self.assertEqual(1, len(list(manifest.valid_entries())))
+        cache = enable_code_cache()
+        manifest.prefetch(background=False)
+        self.assertEqual(1, cache.cache_info().misses)
+
+    def test_prefetch_same_path(self) -> None:
+        with Manifest(self.path):
+            Location('app/a.py:x').load()
+            Location('app/a.py').load(modname=random_name)
+        manifest = Manifest(self.path)
+        self.assertEqual(2, len(list(manifest.valid_entries())))
+        cache = enable_code_cache()
+        manifest.prefetch(background=False)
+        self.assertEqual((0, 1), tuple(cache.cache_info())[:2])
+
+    def test_stale_entries(self) -> None:
+        self.record()
+        path = self.layout.cwd / 'app/a.py'
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        (self.layout.cwd / 'app/b.py').unlink()
+        manifest = Manifest(self.path)
+        self.assertEqual([], list(manifest.valid_entries()))
+        cache = enable_code_cache()
+        manifest.prefetch(background=False)
+        self.assertEqual(0, cache.cache_info().currsize)
+
+    def test_invalid_file(self) -> None:
+        self.path.write_text('{')
+        self.assertEqual({}, Manifest(self.path).entries)
+        self.path.write_text('{"version": 0, "entries": [{}]}')
+        self.assertEqual({}, Manifest(self.path).entries)
+
+    def test_malformed_file(self) -> None:
+        for text in ('[]', '1', 'null', '{"version": 1, "entries": [1]}'):
+            with self.subTest(text=text):
+                self.path.write_text(text)
+                self.assertEqual({}, Manifest(self.path).entries)
@@ -26,6 +26,11 @@ sample2 = Sample2('y')
 sample3 = Sample3('x')
 
 
+class Container:
+    item2 = Sample2('b')
+    item1 = Sample1('a')
+
+
 # tests
 
 
@@ -63,8 +68,9 @@ class OrderInGetFunctions(TestCase):
     # source order
 
     def test_instance_source_order(self) -> None:
-        with self.assertRaises(TypeError):
-            get_instances(self.module, self.Base, order='source')
+        expected_objects = [sample1, sample2, sample3]
+        objects = get_instances(self.module, self.Base, order='source')
+        self.assertListEqual(expected_objects, objects)
         expected = [Sample3, Sample1, Sample2]
         all_types = get_instances(self.module, type, order='source')
         sample_types = [c for c in all_types if c.__name__.startswith('Sample')]
@@ -78,6 +84,16 @@ class OrderInGetFunctions(TestCase):
         classes = get_subclasses(self.module, self.Base, order='source')
         self.assertListEqual(expected, [c.__name__ for c in classes])
 
+    def test_class_attribute_source_order(self) -> None:
+        container = self.module.Container  # type: ignore[attr-defined]
+        expected = [container.item2, container.item1]
+        objects = get_instances(container, self.Base, order='source')
+        self.assertListEqual(expected, objects)
+
+    def test_unknown_source_order(self) -> None:
+        with self.assertRaises(TypeError):
+            get_instances(self.module, str, order='source')
+
     # custom order
 
     def test_instance_custom_order(self) -> None:
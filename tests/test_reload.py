@@ -0,0 +1,83 @@
+import os
+from pathlib import Path
+import sys
+from unittest import TestCase
+
+from importloc import LoadEvent, Location, reload, subscribe, unsubscribe
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+def touch(path: Path, text: str) -> None:
+    st = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class ReloadIfChangedTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self, File('app/config.py', 'x = 1\n'), File('lib/tools.py', 'x = 1\n')
+        )
+        self.path = self.layout.cwd / 'app/config.py'
+        Location('app/config.py').load()
+        self.mod = sys.modules['config']
+
+    def load_x(self) -> object:
+        return Location('app/config.py:x').load(on_conflict='reload_if_changed')
+
+    def test_unchanged(self) -> None:
+        setattr(self.mod, 'x', 'original')  # noqa: B010
+        self.assertEqual('original', self.load_x())
+        self.assertFalse(reload('config', if_changed=True))
+
+    def test_changed(self) -> None:
+        touch(self.path, 'x = 22\n')
+        self.assertEqual(22, self.load_x())
+        self.assertIs(self.mod, sys.modules['config'])
+        self.assertFalse(reload(self.mod, if_changed=True))
+
+    def test_touched_same_content(self) -> None:
+        touch(self.path, 'x = 2\n')
+        self.assertTrue(reload(self.mod, if_changed=True))
+        setattr(self.mod, 'x', 'reloaded')  # noqa: B010
+        # same size, same content, new mtime: content hash is compared
+        touch(self.path, 'x = 2\n')
+        self.assertFalse(reload(self.mod, if_changed=True))
+        self.assertEqual('reloaded', self.load_x())
+        # same size, different content
+        touch(self.path, 'x = 3\n')
+        self.assertEqual(3, self.load_x())
+
+    def test_reported_in_event(self) -> None:
+        events: list[LoadEvent] = []
+        subscribe(events.append)
+        try:
+            self.load_x()
+            touch(self.path, 'x = 22\n')
+            self.load_x()
+        finally:
+            unsubscribe(events.append)
+        loads = [e for e in events if e.modname is not None]
+        self.assertEqual([False, True], [e.reloaded for e in loads])
+
+    def test_unconditional(self) -> None:
+        self.assertTrue(reload('config'))
+
+    def test_module_location(self) -> None:
+        sys.path.insert(0, str(self.layout.cwd / 'lib'))
+        try:
+            Location('tools').load()
+            mod = sys.modules['tools']
+            # fingerprint recorded after import by name
+            self.assertFalse(reload(mod, if_changed=True))
+            path = self.layout.cwd / 'lib/tools.py'
+            path.write_text(path.read_text() + '\n# changed\n')
+            self.assertTrue(reload(mod, if_changed=True))
+            self.assertFalse(reload(mod, if_changed=True))
+        finally:
+            sys.path.remove(str(self.layout.cwd / 'lib'))
+
+    def test_builtin_module(self) -> None:
+        self.assertFalse(reload('sys', if_changed=True))
@@ -0,0 +1,100 @@
+import sys
+from typing import Any
+from unittest import TestCase
+
+from importloc import iter_instances, iter_subclasses, walk_modules
+from importloc.dirlay import DirectoryLayout, File
+from importloc.scan import find_candidates
+
+from .util import use_layout
+
+
+def plugins_layout() -> DirectoryLayout:
+    return DirectoryLayout(
+        files=(
+            File('base.py', 'class Plugin: ...'),
+            File('plugins/__init__.py', 'from plugins.b import B'),
+            File('plugins/a.py', 'from base import Plugin\nclass A(Plugin): ...'),
+            File('plugins/b.py', 'from base import Plugin\nclass B(Plugin): ...'),
+            File('plugins/broken.py', 'raise RuntimeError'),
+            File('plugins/sub/__init__.py', ''),
+            File(
+                'plugins/sub/c.py',
+                'from base import Plugin\nclass C(Plugin): ...\nc1 = C()\nc2 = C()',
+            ),
+            File('plugins/sub/d.py', 'from plugins.sub.c import c1'),
+        ),
+    )
+
+
+class ScanTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(self, *plugins_layout().files, sys_path='.')
+        self.errors: list[tuple[str, Exception]] = []
+        from base import Plugin  # type: ignore[import-not-found]
+
+        self.Plugin: Any = Plugin
+
+    def onerror(self, name: str, exc: Exception) -> None:
+        self.errors.append((name, exc))
+
+    def test_walk_modules(self) -> None:
+        names = [m.__name__ for m in walk_modules('plugins', onerror=self.onerror)]
+        expected = ['plugins', 'plugins.a', 'plugins.b', 'plugins.sub']
+        self.assertEqual(expected + ['plugins.sub.c', 'plugins.sub.d'], names)
+        self.assertEqual(['plugins.broken'], [name for name, _ in self.errors])
+        self.assertNotIn('plugins.broken', sys.modules)
+
+    def test_errors_propagated(self) -> None:
+        with self.assertRaises(ImportError):
+            list(walk_modules('plugins', workers=2))
+
+    def test_iter_subclasses(self) -> None:
+        found = iter_subclasses('plugins', self.Plugin, onerror=self.onerror)
+        self.assertEqual(['A', 'B', 'C'], [c.__name__ for c in found])
+
+    def test_stop_early(self) -> None:
+        found = iter_subclasses('plugins', self.Plugin, workers=2)
+        self.assertEqual('A', next(found).__name__)
+        self.assertNotIn('plugins.sub', sys.modules)
+
+    def test_iter_instances(self) -> None:
+        found = list(iter_instances('plugins', self.Plugin, onerror=self.onerror))
+        c = sys.modules['plugins.sub.c']
+        self.assertEqual([c.c1, c.c2], found)
+
+
+class StaticScanTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self,
+            *plugins_layout().files,
+            File(
+                'plugins/e.py',
+                'from plugins.sub.c import C as Alias\nclass E(Alias): ...',
+            ),
+            File('plugins/f.py', 'import base\nclass F(base.Plugin): ...\nf = F()'),
+            File('plugins/unrelated.py', 'class X: ...'),
+            sys_path='.',
+        )
+        from base import Plugin
+
+        self.Plugin: Any = Plugin
+
+    def test_find_candidates(self) -> None:
+        found = find_candidates('plugins', self.Plugin, 'subclasses')
+        names = ['plugins.a', 'plugins.b', 'plugins.e', 'plugins.f', 'plugins.sub.c']
+        self.assertEqual(names, [n for n, _ in found])
+        self.assertNotIn('plugins', sys.modules)
+        found = find_candidates('plugins', self.Plugin, 'instances')
+        self.assertEqual(['plugins.f', 'plugins.sub.c'], [n for n, _ in found])
+
+    def test_only_candidates_imported(self) -> None:
+        found = iter_subclasses('plugins', self.Plugin, static=True, workers=2)
+        self.assertEqual(['A', 'B', 'E', 'F', 'C'], [c.__name__ for c in found])
+        self.assertNotIn('plugins.unrelated', sys.modules)
+        self.assertNotIn('plugins.broken', sys.modules)
+
+    def test_static_instances(self) -> None:
+        found = iter_instances('plugins', self.Plugin, static=True)
+        self.assertEqual(['F', 'C', 'C'], [type(o).__name__ for o in found])
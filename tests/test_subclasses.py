@@ -0,0 +1,51 @@
+from types import ModuleType
+from unittest import TestCase
+
+from importloc import get_subclasses, walk_subclasses
+
+
+# sample data
+
+
+class Base: ...
+
+
+class Left(Base): ...
+
+
+class Right(Base): ...
+
+
+class Diamond(Left, Right): ...
+
+
+# tests
+
+
+class HierarchyLookup(TestCase):
+    def test_diamond_deduplicated(self) -> None:
+        found = list(walk_subclasses(Base, module=__name__))
+        self.assertEqual([Left, Diamond, Right], found)
+
+    def test_deep_hierarchy(self) -> None:
+        cls: type = Base
+        for _ in range(300):
+            cls = type('Deep', (cls,), {'__module__': 'deep.nested'})
+        found = list(walk_subclasses(Base, package='deep'))
+        self.assertEqual(300, len(found))
+        self.assertEqual([], list(walk_subclasses(Base, package='dee')))
+
+    def test_module_membership(self) -> None:
+        mod = ModuleType('reexport')
+        mod.Diamond = Diamond  # type: ignore[attr-defined]
+        mod.Alias = Left  # type: ignore[attr-defined]
+        self.assertEqual([Diamond], list(walk_subclasses(Base, module=mod)))
+
+    def test_same_as_members_lookup(self) -> None:
+        import tests.test_subclasses as mod
+
+        for order in ('name', 'source'):
+            self.assertListEqual(
+                get_subclasses(mod, Base, order=order),
+                get_subclasses(mod, Base, order=order, lookup='hierarchy'),
+            )
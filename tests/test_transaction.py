@@ -0,0 +1,66 @@
+import sys
+from unittest import TestCase
+
+from importloc import Location
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+class TransactionTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self,
+            File('lib/dep1.py', 'import dep2\n'),
+            File('lib/dep2.py', ''),
+            File('lib/pkg/__init__.py', 'from . import sub\n1/0\n'),
+            File('lib/pkg/sub.py', ''),
+            File('app/bad.py', 'import dep1\n1/0\n'),
+            File('app/good.py', 'import dep1\n'),
+            File('app/outer.py', 'import inner\nimport dep1\n'),
+            sys_path='lib',
+        )
+        self.prevmodules = set(sys.modules)
+
+    def test_default_keeps_dependencies(self) -> None:
+        with self.assertRaises(ImportError):
+            Location('app/bad.py').load()
+        self.assertNotIn('bad', sys.modules)
+        self.assertIn('dep1', sys.modules)
+        self.assertIn('dep2', sys.modules)
+
+    def test_rollback_dependencies(self) -> None:
+        with self.assertRaises(ImportError):
+            Location('app/bad.py').load(transaction=True)
+        self.assertEqual(set(), set(sys.modules) - self.prevmodules)
+
+    def test_rollback_submodules(self) -> None:
+        with self.assertRaises(ImportError):
+            Location('pkg').load(transaction=True)
+        self.assertNotIn('pkg.sub', sys.modules)
+        self.assertNotIn('pkg', sys.modules)
+
+    def test_commit(self) -> None:
+        Location('app/good.py').load(transaction=True)
+        self.assertIn('dep1', sys.modules)
+        self.assertIn('dep2', sys.modules)
+
+    def test_restore_replaced(self) -> None:
+        Location('app/good.py').load()
+        dep1 = sys.modules['dep1']
+        del sys.modules['dep1']
+        with self.assertRaises(ImportError):
+            Location('app/bad.py').load(transaction=True)
+        self.assertNotIn('dep1', sys.modules)
+        sys.modules['dep1'] = dep1
+
+    def test_nested(self) -> None:
+        # inner transaction commits, outer one fails and rolls back both
+        (self.layout.cwd / 'lib/inner.py').write_text(
+            'from importloc import Location\n'
+            "Location('app/good.py').load(transaction=True)\n"
+            '1/0\n'
+        )
+        with self.assertRaises(ImportError):
+            Location('app/outer.py').load(transaction=True)
+        self.assertEqual(set(), set(sys.modules) - self.prevmodules)
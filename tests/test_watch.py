@@ -0,0 +1,102 @@
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Literal
+from unittest import TestCase, mock, skipUnless
+
+from importloc import PathLocation, ReloadEvent, Watcher
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+def touch(path: Path, text: str) -> None:
+    st = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class WatcherTestCase(TestCase):
+    backend: Literal['inotify', 'poll'] = 'poll'
+
+    def setUp(self) -> None:
+        self.layout = use_layout(
+            self,
+            File('plugins/a.py', 'x = 1\n'),
+            File('plugins/b.py', 'x = 2\n'),
+            File('other/c.py', 'x = 3\n'),
+        )
+        self.locs = [PathLocation(f'{f.path}:x') for f in self.layout.files]
+        for loc in self.locs:
+            loc.load()
+        self.events: list[ReloadEvent] = []
+        self.watcher = Watcher(
+            self.locs,
+            self.events.append,
+            debounce=0,
+            backend=self.backend,
+        )
+
+    def tearDown(self) -> None:
+        self.watcher.close()
+
+    def check(self) -> list[ReloadEvent]:
+        return self.watcher.check(timeout=0.5 if self.backend == 'inotify' else 0)
+
+    def test_unchanged(self) -> None:
+        self.assertEqual([], self.watcher.check())
+        self.assertEqual(self.backend, self.watcher.backend)
+
+    def test_changed(self) -> None:
+        touch(self.layout.cwd / 'plugins/b.py', 'x = 22\n')
+        events = self.check()
+        self.assertEqual([ReloadEvent(self.locs[1], 22)], events)
+        self.assertEqual(events, self.events)
+        self.assertEqual(22, sys.modules['b'].x)
+
+    def test_same_content(self) -> None:
+        touch(self.layout.cwd / 'other/c.py', 'x = 3\n')
+        self.assertEqual([], self.check())
+
+    def test_error(self) -> None:
+        touch(self.layout.cwd / 'plugins/a.py', 'x = 1/0\n')
+        (event,) = self.check()
+        self.assertIs(self.locs[0], event.location)
+        self.assertIsNone(event.result)
+        self.assertIsInstance(event.error, ZeroDivisionError)
+        self.assertEqual(1, sys.modules['a'].x)
+
+    def test_removed_while_checked(self) -> None:
+        path = str(self.layout.cwd / 'plugins/a.py')
+        with mock.patch('importloc.watch.os.stat', side_effect=FileNotFoundError):
+            self.assertFalse(self.watcher._content_changed(path))
+
+    def test_debounce(self) -> None:
+        self.watcher.debounce = 60
+        touch(self.layout.cwd / 'plugins/a.py', 'x = 11\n')
+        self.assertEqual([], self.check())
+        self.watcher.debounce = 0
+        self.assertEqual(11, self.watcher.check()[0].result)
+
+
+@skipUnless(sys.platform.startswith('linux'), 'inotify is available on Linux only')
+class InotifyWatcherTestCase(WatcherTestCase):
+    backend: Literal['inotify', 'poll'] = 'inotify'
+
+
+class WatcherThreadTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(self, File('plugins/a.py', 'x = 1\n'), pushd=False)
+
+    def test_background(self) -> None:
+        path = self.layout.cwd / 'plugins/a.py'
+        loc = PathLocation(f'{path}:x')
+        loc.load()
+        events: list[ReloadEvent] = []
+        with Watcher([loc], events.append, interval=0.01, debounce=0, backend='poll'):
+            touch(path, 'x = 11\n')
+            deadline = time.monotonic() + 5
+            while not events and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertEqual([ReloadEvent(loc, 11)], events)
@@ -0,0 +1,111 @@
+import pickle
+import sys
+from unittest import TestCase
+import zipfile
+
+from importloc import (
+    InvalidLocation,
+    Location,
+    ModuleNameConflict,
+    PathLocation,
+    ZipLocation,
+    disable_code_cache,
+    enable_code_cache,
+    reload,
+)
+from importloc.dirlay import File
+
+from .util import use_layout
+
+
+class ZipLocationTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = use_layout(self, File('app/plain.py', 'x = 0\n'))
+        with zipfile.ZipFile(self.layout.cwd / 'bundle.zip', 'w') as zf:
+            zf.writestr('pkg/config.py', 'class Config:\n    x = 1\n')
+            zf.writestr('pkg/broken.py', '1/0\n')
+            zf.writestr('pkg/data.txt', 'text')
+
+    def test_parse(self) -> None:
+        loc = Location('bundle.zip/pkg/config.py:Config.x')
+        self.assertIsInstance(loc, ZipLocation)
+        assert isinstance(loc, ZipLocation)
+        self.assertEqual('bundle.zip', str(loc.archive))
+        self.assertEqual('pkg/config.py', loc.member)
+        self.assertEqual('Config.x', loc.obj)
+        self.assertEqual(
+            loc,
+            ZipLocation(archive='bundle.zip', member='pkg/config.py', obj='Config.x'),
+        )
+        self.assertEqual(loc, pickle.loads(pickle.dumps(loc)))  # noqa: S301
+        self.assertIsInstance(Location('app/plain.py'), PathLocation)
+        with self.assertRaises(InvalidLocation):
+            ZipLocation('app/plain.py')
+        with self.assertRaises(ValueError):
+            ZipLocation(archive='bundle.zip')
+
+    def test_zip_named_directory(self) -> None:
+        # parsed before the directory exists, checked when loading
+        loc = Location('plugins.zip/a.py:x')
+        self.assertIsInstance(loc, ZipLocation)
+        (self.layout.cwd / 'plugins.zip').mkdir()
+        (self.layout.cwd / 'plugins.zip/a.py').write_text('x = 1\n')
+        self.assertEqual(1, loc.load())
+        self.assertIs(loc, Location('plugins.zip/a.py:x'))
+        self.assertEqual(
+            1, PathLocation('plugins.zip/a.py:x').load(on_conflict='reuse')
+        )
+
+    def test_load(self) -> None:
+        self.assertEqual(1, Location('bundle.zip/pkg/config.py:Config.x').load())
+        mod = sys.modules['config']
+        self.assertTrue(
+            mod.__file__ and mod.__file__.endswith('bundle.zip/pkg/config.py')
+        )
+        with self.assertRaises(ModuleNameConflict):
+            Location('bundle.zip/pkg/config.py').load()
+        self.assertIs(
+            mod, Location('bundle.zip/pkg/config.py').load(on_conflict='reuse')
+        )
+        # archive members are never reported as changed
+        self.assertFalse(reload(mod, if_changed=True))
+
+    def test_modname(self) -> None:
+        Location('bundle.zip/pkg/config.py').load(modname='pkg.config')
+        self.assertIn('pkg.config', sys.modules)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            Location('missing.zip/pkg/config.py').load()
+        with self.assertRaises(FileNotFoundError):
+            Location('bundle.zip/pkg/missing.py').load()
+        (self.layout.cwd / 'dir.zip').mkdir()
+        with self.assertRaises(FileNotFoundError):
+            ZipLocation('dir.zip/config.py').load()
+        with self.assertRaises(ImportError):
+            Location('bundle.zip/pkg/broken.py').load()
+        self.assertNotIn('broken', sys.modules)
+
+    def test_rollback(self) -> None:
+        Location('bundle.zip/pkg/config.py').load(modname='broken')
+        old = sys.modules['broken']
+        with self.assertRaises(ImportError):
+            Location('bundle.zip/pkg/broken.py').load(on_conflict='replace')
+        self.assertIs(old, sys.modules['broken'])
+
+    def test_archive_changed(self) -> None:
+        Location('bundle.zip/pkg/config.py').load()
+        with zipfile.ZipFile(self.layout.cwd / 'bundle.zip', 'w') as zf:
+            zf.writestr('pkg/config.py', 'class Config:\n    x = 22222\n')
+        x = Location('bundle.zip/pkg/config.py:Config.x').load(on_conflict='replace')
+        self.assertEqual(22222, x)
+
+    def test_code_cache(self) -> None:
+        cache = enable_code_cache()
+        try:
+            loc = Location('bundle.zip/pkg/config.py')
+            for _ in range(2):
+                loc.load(on_conflict='replace')
+            self.assertEqual(1, cache.cache_info().hits)
+        finally:
+            disable_code_cache()
@@ -0,0 +1,37 @@
+import sys
+from typing import Optional
+from unittest import TestCase
+
+from importloc.dirlay import DirectoryLayout, File
+
+
+def use_layout(
+    test: TestCase,
+    *files: File,
+    pushd: bool = True,
+    sys_path: Optional[str] = None,
+) -> DirectoryLayout:
+    """
+    Create directory layout with ``files`` for the duration of the test.
+
+    Layout directory is made current unless ``pushd`` is `False`, and its
+    subdirectory ``sys_path`` is prepended to `sys.path`, if given. On cleanup,
+    modules imported during the test are removed from `sys.modules`.
+    """
+    layout = DirectoryLayout(files=files)
+    layout.create()
+    test.addCleanup(layout.destroy)
+    if pushd:
+        layout.pushd()
+        test.addCleanup(layout.popd)
+    if sys_path is not None:
+        path = str(layout.cwd / sys_path)
+        sys.path.insert(0, path)
+        test.addCleanup(sys.path.remove, path)
+    test.addCleanup(forget_modules, set(sys.modules))
+    return layout
+
+
+def forget_modules(prevmodules: set[str]) -> None:
+    for m in set(sys.modules) - prevmodules:
+        del sys.modules[m]